@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+"""
+Generate the JSON schema documents shipped with astra_model
+
+Writes one document per schema to ``src/astra_model/_schemas/<name>.json``
+from the definitions in ``astra_model._schema_sources``, and the validators
+generated from them to ``src/astra_model/_validators.py``. Run this after
+editing the schema definitions:
+
+    python scripts/generate_schemas.py
+
+Pass ``--check`` to exit with an error if the documents are out of date.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from astra_model._codegen import generate_module  # noqa: E402
+from astra_model._schema_sources import SOURCES, build_schema  # noqa: E402
+
+PACKAGE_DIR = SRC_DIR / "astra_model"
+OUTPUT_DIR = PACKAGE_DIR / "_schemas"
+VALIDATORS_PATH = PACKAGE_DIR / "_validators.py"
+
+
+def render(name: str) -> str:
+    """Render a schema document as indented JSON"""
+    return json.dumps(build_schema(name), indent=2, ensure_ascii=False) + "\n"
+
+
+def render_validators() -> str:
+    """Render the module of generated validators"""
+    return generate_module({name: build_schema(name) for name in SOURCES})
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="fail if any generated document is missing or out of date",
+    )
+    args = parser.parse_args()
+
+    outputs = {OUTPUT_DIR / f"{name}.json": render(name) for name in SOURCES}
+    outputs[VALIDATORS_PATH] = render_validators()
+
+    stale = []
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    for path, content in outputs.items():
+        if path.exists() and path.read_text(encoding="utf-8") == content:
+            continue
+        stale.append(path)
+        if not args.check:
+            path.write_text(content, encoding="utf-8")
+
+    for path in stale:
+        action = "Out of date" if args.check else "Wrote"
+        print(f"{action}: {path.relative_to(SRC_DIR.parent)}")
+    return 1 if args.check and stale else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
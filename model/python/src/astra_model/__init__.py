@@ -7,59 +7,161 @@ ASTRA provides shared structure so different conversational runtimes and applica
 It defines the canonical data model for representing conversational state as typed, auditable sequences of actions.
 """
 
-from .types import (
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .types import (
+        # Base types
+        Act,
+        ActType,
+        Source,
+        ActMetadata,
+
+        # Entity types
+        Entity,
+        EntityRef,
+
+        # Constraint types
+        Constraint,
+        ConstraintType,
+        FormatType,
+        RangeConstraint,
+
+        # Participant types
+        Participant,
+        ParticipantType,
+        ParticipantPreferences,
+
+        # Act types
+        Ask,
+        ExpectedType,
+        Fact,
+        FieldOperation,
+        ValidationStatus,
+        Confirm,
+        ConfirmationMethod,
+        Commit,
+        CommitAction,
+        CommitStatus,
+        CommitError,
+        Error,
+        ErrorSeverity,
+        ErrorCategory,
+        SuggestedAction,
+
+        # Conversation types
+        ConversationAct,
+        ConversationStatus,
+        ConversationContext,
+        ConversationMetadata,
+        Conversation,
+        ConversationCache,
+        ActColumns,
+        LazyActs,
+        LazyConversation,
+
+        # Utility functions
+        generate_act_id,
+        generate_conversation_id,
+        is_valid_act_id,
+        is_valid_conversation_id,
+        create_base_act,
+        create_act,
+        make_act,
+        decode_act,
+        iter_acts,
+        ensure_built,
+    )
+
+    from .schemas import (
+        SCHEMAS,
+        SCHEMAS_JSON,
+        SchemaValidationError,
+        ensure_compiled,
+        get_schema,
+        get_validator,
+        validate,
+        validate_batch,
+        validate_shallow,
+    )
+
+# Public names and the submodule that defines them. Submodules are imported on
+# first attribute access so that ``import astra_model`` stays cheap and only the
+# Pydantic models a caller actually touches get built.
+_LAZY = {
     # Base types
-    Act,
-    ActType,
-    Source,
-    ActMetadata,
-    
+    "Act": ".types",
+    "ActType": ".types",
+    "Source": ".types",
+    "ActMetadata": ".types",
+
     # Entity types
-    Entity,
-    EntityRef,
-    
+    "Entity": ".types",
+    "EntityRef": ".types",
+
     # Constraint types
-    Constraint,
-    ConstraintType,
-    FormatType,
-    RangeConstraint,
-    
+    "Constraint": ".types",
+    "ConstraintType": ".types",
+    "FormatType": ".types",
+    "RangeConstraint": ".types",
+
     # Participant types
-    Participant,
-    ParticipantType,
-    ParticipantPreferences,
-    
+    "Participant": ".types",
+    "ParticipantType": ".types",
+    "ParticipantPreferences": ".types",
+
     # Act types
-    Ask,
-    ExpectedType,
-    Fact,
-    FieldOperation,
-    ValidationStatus,
-    Confirm,
-    ConfirmationMethod,
-    Commit,
-    CommitAction,
-    CommitStatus,
-    CommitError,
-    Error,
-    ErrorSeverity,
-    ErrorCategory,
-    SuggestedAction,
-    
+    "Ask": ".types",
+    "ExpectedType": ".types",
+    "Fact": ".types",
+    "FieldOperation": ".types",
+    "ValidationStatus": ".types",
+    "Confirm": ".types",
+    "ConfirmationMethod": ".types",
+    "Commit": ".types",
+    "CommitAction": ".types",
+    "CommitStatus": ".types",
+    "CommitError": ".types",
+    "Error": ".types",
+    "ErrorSeverity": ".types",
+    "ErrorCategory": ".types",
+    "SuggestedAction": ".types",
+
     # Conversation types
-    ConversationAct,
-    ConversationStatus,
-    ConversationContext,
-    ConversationMetadata,
-    Conversation,
-    
+    "ConversationAct": ".types",
+    "ConversationStatus": ".types",
+    "ConversationContext": ".types",
+    "ConversationMetadata": ".types",
+    "Conversation": ".types",
+    "ConversationCache": ".types",
+    "ActColumns": ".types",
+    "LazyActs": ".types",
+    "LazyConversation": ".types",
+
     # Utility functions
-    generate_act_id,
-    generate_conversation_id,
-    create_base_act,
-)
+    "generate_act_id": ".types",
+    "generate_conversation_id": ".types",
+    "is_valid_act_id": ".types",
+    "is_valid_conversation_id": ".types",
+    "create_base_act": ".types",
+    "create_act": ".types",
+    "make_act": ".types",
+    "decode_act": ".types",
+    "iter_acts": ".types",
+    "ensure_built": ".types",
 
-from .schemas import SCHEMAS
+    # Schemas
+    "SCHEMAS": ".schemas",
+    "SCHEMAS_JSON": ".schemas",
+    "get_schema": ".schemas",
+    "ensure_compiled": ".schemas",
+    "get_validator": ".schemas",
+    "validate": ".schemas",
+    "validate_batch": ".schemas",
+    "validate_shallow": ".schemas",
+    "SchemaValidationError": ".schemas",
+}
 
 # Package metadata
 __version__ = "1.0.0"
@@ -68,65 +170,29 @@ __author__ = "Pryszm"
 __license__ = "Apache-2.0"
 __description__ = "Python types and JSON schemas for ASTRA conversations"
 
-# Export all public APIs
-__all__ = [
-    # Base types
-    "Act",
-    "ActType", 
-    "Source",
-    "ActMetadata",
-    
-    # Entity types
-    "Entity",
-    "EntityRef",
-    
-    # Constraint types
-    "Constraint",
-    "ConstraintType",
-    "FormatType", 
-    "RangeConstraint",
-    
-    # Participant types
-    "Participant",
-    "ParticipantType",
-    "ParticipantPreferences",
-    
-    # Act types
-    "Ask",
-    "ExpectedType",
-    "Fact",
-    "FieldOperation",
-    "ValidationStatus",
-    "Confirm",
-    "ConfirmationMethod",
-    "Commit",
-    "CommitAction",
-    "CommitStatus",
-    "CommitError", 
-    "Error",
-    "ErrorSeverity",
-    "ErrorCategory",
-    "SuggestedAction",
-    
-    # Conversation types
-    "ConversationAct",
-    "ConversationStatus",
-    "ConversationContext",
-    "ConversationMetadata",
-    "Conversation",
-    
-    # Utility functions
-    "generate_act_id",
-    "generate_conversation_id",
-    "create_base_act",
-    
-    # Schemas
-    "SCHEMAS",
-    
+# Export all public APIs. Derived from _LAZY so the two cannot drift apart.
+__all__ = (
+    *_LAZY,
+
     # Package metadata
     "__version__",
     "__schema_version__",
     "__author__",
     "__license__",
     "__description__",
-]
+)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,532 @@
+"""
+Generate specialized validation functions for ASTRA JSON schemas
+
+The ASTRA schemas are static, so instead of walking a schema for every
+instance, each schema is translated once into straight-line Python: required
+properties become unrolled ``in`` checks, patterns are bound to their
+compiled ``search`` method, enums become frozenset lookups, a ``oneOf``
+over objects tagged by a const property becomes a branch on the tag, and
+``$ref`` targets become functions that are generated once and called
+directly.
+
+Only the keywords the ASTRA schemas use are supported. Generating a validator
+for a schema with any other keyword raises NotImplementedError rather than
+silently skipping the check.
+"""
+
+import inspect
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from .schemas import get_enum, get_pattern
+
+# Keywords that do not affect validation. Formats are not asserted, matching
+# the other validation backends.
+_ANNOTATIONS = frozenset({
+    "$schema", "$id", "$comment", "title", "description", "default",
+    "examples", "format", "definitions",
+})
+
+_KEYWORDS = frozenset({
+    "$ref", "allOf", "oneOf", "if", "then", "else", "type", "enum", "const",
+    "required", "properties", "additionalProperties",
+    "items", "minItems", "pattern", "minimum", "maximum",
+}) | _ANNOTATIONS
+
+# Type checks with JSON Schema semantics: booleans are not numbers, and
+# integral floats are integers
+_TYPE_CHECKS = {
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "string": "isinstance({v}, str)",
+    "integer": (
+        "(isinstance({v}, int) and not isinstance({v}, bool)"
+        " or isinstance({v}, float) and {v}.is_integer())"
+    ),
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+}
+
+# Keywords that only apply to instances of one type
+_OBJECT_KEYWORDS = ("required", "properties", "additionalProperties")
+_ARRAY_KEYWORDS = ("minItems", "items")
+_STRING_KEYWORDS = ("pattern",)
+_NUMBER_KEYWORDS = ("minimum", "maximum")
+
+
+def _escape(token: str) -> str:
+    """Escape a JSON pointer token"""
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+class _Generator:
+    """Translates a schema and the subschemas it references into functions"""
+
+    def __init__(self, root: Mapping[str, Any], prefix: str = "") -> None:
+        self._root = root
+        self._prefix = prefix
+        self._functions: Dict[str, str] = {}
+        self._lines: List[str] = []
+        self._counter = 0
+        # Constants referenced by the functions, and the source recreating them
+        self.namespace: Dict[str, Any] = {}
+        self.constants: Dict[str, str] = {}
+
+    def source(self) -> str:
+        """Source of all functions generated so far"""
+        return "\n".join(self._lines)
+
+    def _name(self, prefix: str) -> str:
+        self._counter += 1
+        return f"{prefix}{self._counter}"
+
+    def _constant(self, prefix: str, value: Any, source: str) -> str:
+        name = self._prefix + self._name(prefix)
+        self.namespace[name] = value
+        self.constants[name] = source
+        return name
+
+    def _resolve(self, ref: str) -> Any:
+        if not ref.startswith("#"):
+            raise NotImplementedError(f"Unsupported non-local $ref: {ref!r}")
+        target: Any = self._root
+        for token in ref[1:].split("/")[1:]:
+            token = token.replace("~1", "/").replace("~0", "~")
+            target = target[int(token)] if isinstance(target, Sequence) else target[token]
+        return target
+
+    def function(self, schema: Any, pointer: str) -> str:
+        """Name of the function validating against the subschema at pointer"""
+        try:
+            return self._functions[pointer]
+        except KeyError:
+            pass
+        name = self._functions[pointer] = self._prefix + self._name("_validate_")
+        body: List[str] = []
+        self._emit(schema, "data", ("path", ()), pointer, body, 1)
+        self._lines.append(f"def {name}(data: Any, path: Tuple[Any, ...]) -> None:")
+        self._lines.extend(body or ["    pass"])
+        self._lines.extend(["", ""])
+        return name
+
+    def _emit(
+        self,
+        schema: Any,
+        var: str,
+        path: Tuple[str, Tuple[str, ...]],
+        pointer: str,
+        out: List[str],
+        depth: int,
+    ) -> None:
+        """Append the checks of a subschema against the local ``var`` to out"""
+        pad = "    " * depth
+        base, parts = path
+        path_expr = f"{base} + ({', '.join(parts)},)" if parts else base
+
+        def fail(message: str, *args: str) -> None:
+            text = repr(message) if not args else f"{message!r} % ({', '.join(args)},)"
+            out.append(f"{pad}    raise _fail({path_expr}, {text})")
+
+        if schema is True:
+            return
+        if schema is False:
+            out.append(f"{pad}if True:")
+            fail("is not allowed")
+            return
+
+        unknown = set(schema) - _KEYWORDS
+        if unknown:
+            raise NotImplementedError(
+                f"Unsupported keywords at {pointer}: {', '.join(sorted(unknown))}"
+            )
+
+        if "$ref" in schema:
+            ref = schema["$ref"]
+            function = self.function(self._resolve(ref), ref)
+            out.append(f"{pad}{function}({var}, {path_expr})")
+
+        for index, subschema in enumerate(schema.get("allOf", ())):
+            self._emit(subschema, var, path, f"{pointer}/allOf/{index}", out, depth)
+
+        discriminator = self._discriminator(schema["oneOf"]) if "oneOf" in schema else None
+        if discriminator is not None:
+            # Objects can only match the subschema whose const value they
+            # carry, so dispatch on it instead of trying every subschema
+            key, tag_values = discriminator
+            tag = self._name("tag")
+            out.append(f"{pad}{tag} = {var}.get({key!r}) if isinstance({var}, dict) else None")
+            for index, (value, subschema) in enumerate(zip(tag_values, schema["oneOf"])):
+                function = self.function(subschema, f"{pointer}/oneOf/{index}")
+                out.append(f"{pad}{'if' if index == 0 else 'elif'} {tag} == {value!r}:")
+                out.append(f"{pad}    {function}({var}, {path_expr})")
+            out.append(f"{pad}else:")
+            fail("must match exactly one schema in oneOf (matched 0)")
+        elif "oneOf" in schema:
+            count = self._name("matched")
+            out.append(f"{pad}{count} = 0")
+            for index, subschema in enumerate(schema["oneOf"]):
+                function = self.function(subschema, f"{pointer}/oneOf/{index}")
+                out.append(f"{pad}try:")
+                out.append(f"{pad}    {function}({var}, {path_expr})")
+                out.append(f"{pad}    {count} += 1")
+                out.append(f"{pad}except _Invalid:")
+                out.append(f"{pad}    pass")
+            out.append(f"{pad}if {count} != 1:")
+            fail("must match exactly one schema in oneOf (matched %d)", count)
+
+        if "if" in schema:
+            self._emit_conditional(schema, var, path, pointer, out, depth)
+
+        types: Tuple[str, ...] = ()
+        if "type" in schema:
+            types = (schema["type"],) if isinstance(schema["type"], str) else tuple(schema["type"])
+            check = " or ".join(_TYPE_CHECKS[name].format(v=var) for name in types)
+            out.append(f"{pad}if not ({check}):")
+            fail(f"must be {' or '.join(types)}")
+
+        if "enum" in schema:
+            values = tuple(schema["enum"])
+            if not all(isinstance(value, str) for value in values):
+                raise NotImplementedError(f"Unsupported non-string enum at {pointer}")
+            allowed = self._constant("_enum_", get_enum(values), f"frozenset({values!r})")
+            # The type check above already rules out unhashable values. An
+            # isascii() guard would not help: set lookups and the compiled
+            # patterns are no faster on ASCII strings, only extra work for
+            # valid values.
+            if schema.get("type") == "string":
+                out.append(f"{pad}if {var} not in {allowed}:")
+            else:
+                out.append(f"{pad}if not isinstance({var}, str) or {var} not in {allowed}:")
+            fail(f"must be one of {list(values)!r}")
+
+        if "const" in schema:
+            value = schema["const"]
+            if not isinstance(value, str):
+                raise NotImplementedError(f"Unsupported non-string const at {pointer}")
+            out.append(f"{pad}if {var} != {value!r}:")
+            fail(f"must be {value!r}")
+
+        for kind, keywords, emit in (
+            ("object", _OBJECT_KEYWORDS, self._emit_object),
+            ("array", _ARRAY_KEYWORDS, self._emit_array),
+            ("string", _STRING_KEYWORDS, self._emit_string),
+            ("number", _NUMBER_KEYWORDS, self._emit_number),
+        ):
+            if not any(keyword in schema for keyword in keywords):
+                continue
+            # The type check above already guarantees the instance type;
+            # otherwise these keywords are skipped for other types
+            if types == (kind,) or (kind == "number" and types == ("integer",)):
+                emit(schema, var, path, pointer, out, depth)
+            else:
+                out.append(f"{pad}if {_TYPE_CHECKS[kind].format(v=var)}:")
+                emit(schema, var, path, pointer, out, depth + 1)
+
+    def _requirements(
+        self, schema: Any, found: Dict[str, Any], refs: FrozenSet[str] = frozenset()
+    ) -> None:
+        """Collect what every instance valid against schema must satisfy
+
+        Follows $ref and allOf, recording in found whether the instance must
+        be an object, its required properties and the string const values of
+        its properties.
+        """
+        if not isinstance(schema, Mapping):
+            return
+        ref = schema.get("$ref")
+        if ref is not None and ref not in refs:
+            self._requirements(self._resolve(ref), found, refs | {ref})
+        for subschema in schema.get("allOf", ()):
+            self._requirements(subschema, found, refs)
+        if schema.get("type") == "object":
+            found["object"] = True
+        found["required"].update(schema.get("required", ()))
+        for name, subschema in schema.get("properties", {}).items():
+            if isinstance(subschema, Mapping) and isinstance(subschema.get("const"), str):
+                found["consts"].setdefault(name, subschema["const"])
+
+    def _discriminator(self, subschemas: Sequence[Any]) -> Optional[Tuple[str, List[str]]]:
+        """Required property with a distinct const value in each subschema, if any"""
+        tags: List[Dict[str, str]] = []
+        for subschema in subschemas:
+            found: Dict[str, Any] = {"object": False, "required": set(), "consts": {}}
+            self._requirements(subschema, found)
+            if not found["object"]:
+                return None
+            tags.append({
+                name: value for name, value in found["consts"].items()
+                if name in found["required"]
+            })
+        for key in tags[0] if tags else ():
+            values = [tag[key] for tag in tags if key in tag]
+            if len(values) == len(tags) and len(set(values)) == len(values):
+                return key, values
+        return None
+
+    def _emit_conditional(
+        self,
+        schema: Mapping[str, Any],
+        var: str,
+        path: Tuple[str, Tuple[str, ...]],
+        pointer: str,
+        out: List[str],
+        depth: int,
+    ) -> None:
+        pad = "    " * depth
+        base, parts = path
+        path_expr = f"{base} + ({', '.join(parts)},)" if parts else base
+
+        branches = {}
+        for keyword in ("then", "else"):
+            checks: List[str] = []
+            if keyword in schema:
+                self._emit(schema[keyword], var, path, f"{pointer}/{keyword}", checks, depth + 1)
+            branches[keyword] = checks or [f"{pad}    pass"]
+
+        condition = schema["if"]
+        if isinstance(condition, Mapping) and set(condition) - _ANNOTATIONS == {"type"}:
+            # A condition on the type alone is a plain isinstance() test
+            types = condition["type"]
+            types = (types,) if isinstance(types, str) else tuple(types)
+            test = " or ".join(_TYPE_CHECKS[name].format(v=var) for name in types)
+            out.append(f"{pad}if {test}:")
+            out.extend(branches["then"])
+            out.append(f"{pad}else:")
+            out.extend(branches["else"])
+            return
+
+        function = self.function(condition, f"{pointer}/if")
+        out.append(f"{pad}try:")
+        out.append(f"{pad}    {function}({var}, {path_expr})")
+        out.append(f"{pad}except _Invalid:")
+        out.extend(branches["else"])
+        out.append(f"{pad}else:")
+        out.extend(branches["then"])
+
+    def _emit_object(
+        self,
+        schema: Mapping[str, Any],
+        var: str,
+        path: Tuple[str, Tuple[str, ...]],
+        pointer: str,
+        out: List[str],
+        depth: int,
+    ) -> None:
+        pad = "    " * depth
+        base, parts = path
+        path_expr = f"{base} + ({', '.join(parts)},)" if parts else base
+
+        for key in schema.get("required", ()):
+            out.append(f"{pad}if {key!r} not in {var}:")
+            out.append(f"{pad}    raise _fail({path_expr}, {f'is missing required property {key!r}'!r})")
+
+        properties = schema.get("properties", {})
+        for key, subschema in properties.items():
+            local = self._name("value")
+            checks: List[str] = []
+            self._emit(
+                subschema,
+                local,
+                (base, parts + (repr(key),)),
+                f"{pointer}/properties/{_escape(key)}",
+                checks,
+                depth + 1,
+            )
+            if checks:
+                out.append(f"{pad}if {key!r} in {var}:")
+                out.append(f"{pad}    {local} = {var}[{key!r}]")
+                out.extend(checks)
+
+        additional = schema.get("additionalProperties", True)
+        if additional is False:
+            allowed = self._constant(
+                "_properties_", frozenset(properties), f"frozenset({tuple(properties)!r})"
+            )
+            key_var = self._name("key")
+            out.append(f"{pad}for {key_var} in {var}:")
+            out.append(f"{pad}    if {key_var} not in {allowed}:")
+            out.append(f"{pad}        raise _fail({path_expr}, 'has unexpected property %r' % ({key_var},))")
+        elif additional is not True:
+            raise NotImplementedError(
+                f"Unsupported additionalProperties schema at {pointer}"
+            )
+
+    def _emit_array(
+        self,
+        schema: Mapping[str, Any],
+        var: str,
+        path: Tuple[str, Tuple[str, ...]],
+        pointer: str,
+        out: List[str],
+        depth: int,
+    ) -> None:
+        pad = "    " * depth
+        base, parts = path
+        path_expr = f"{base} + ({', '.join(parts)},)" if parts else base
+
+        if "minItems" in schema:
+            count = schema["minItems"]
+            out.append(f"{pad}if len({var}) < {count!r}:")
+            out.append(f"{pad}    raise _fail({path_expr}, {f'must contain at least {count} items'!r})")
+
+        if "items" in schema:
+            index = self._name("index")
+            item = self._name("item")
+            checks: List[str] = []
+            self._emit(
+                schema["items"],
+                item,
+                (base, parts + (index,)),
+                f"{pointer}/items",
+                checks,
+                depth + 1,
+            )
+            if checks:
+                out.append(f"{pad}for {index}, {item} in enumerate({var}):")
+                out.extend(checks)
+
+    def _emit_string(
+        self,
+        schema: Mapping[str, Any],
+        var: str,
+        path: Tuple[str, Tuple[str, ...]],
+        pointer: str,
+        out: List[str],
+        depth: int,
+    ) -> None:
+        pad = "    " * depth
+        base, parts = path
+        path_expr = f"{base} + ({', '.join(parts)},)" if parts else base
+
+        pattern = schema["pattern"]
+        search = self._constant(
+            "_search_", get_pattern(pattern).search, f"re.compile({pattern!r}).search"
+        )
+        out.append(f"{pad}if not {search}({var}):")
+        out.append(f"{pad}    raise _fail({path_expr}, {f'must match pattern {pattern!r}'!r})")
+
+    def _emit_number(
+        self,
+        schema: Mapping[str, Any],
+        var: str,
+        path: Tuple[str, Tuple[str, ...]],
+        pointer: str,
+        out: List[str],
+        depth: int,
+    ) -> None:
+        pad = "    " * depth
+        base, parts = path
+        path_expr = f"{base} + ({', '.join(parts)},)" if parts else base
+
+        if "minimum" in schema:
+            minimum = schema["minimum"]
+            out.append(f"{pad}if {var} < {minimum!r}:")
+            out.append(f"{pad}    raise _fail({path_expr}, {f'must be >= {minimum}'!r})")
+        if "maximum" in schema:
+            maximum = schema["maximum"]
+            out.append(f"{pad}if {var} > {maximum!r}:")
+            out.append(f"{pad}    raise _fail({path_expr}, {f'must be <= {maximum}'!r})")
+
+
+def _location(path: Tuple[Any, ...]) -> str:
+    """Format an instance path, e.g. data.acts[0].id"""
+    return "data" + "".join(
+        f"[{part}]" if isinstance(part, int) else f".{part}" for part in path
+    )
+
+
+def generate(schema: Mapping[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    """Generate the source of a validator and the constants it refers to
+
+    The source defines ``validate(data)``. It must be executed in a copy of
+    the returned namespace with ``_fail(path, message)`` and ``_Invalid``
+    added; compile_validator() does this.
+    """
+    generator = _Generator(schema)
+    root = generator.function(schema, "#")
+    source = generator.source() + f"\ndef validate(data: Any) -> None:\n    {root}(data, ())\n"
+    return source, generator.namespace
+
+
+def compile_validator(
+    schema: Mapping[str, Any], error: Type[Exception]
+) -> Callable[[Any], None]:
+    """Compile a schema into a function raising ``error`` on invalid instances"""
+    source, namespace = generate(schema)
+
+    def _fail(path: Tuple[Any, ...], message: str) -> Exception:
+        return error(f"{_location(path)} {message}")
+
+    namespace = {
+        **namespace,
+        "Any": Any,
+        "Tuple": Tuple,
+        "_fail": _fail,
+        "_Invalid": error,
+    }
+    exec(compile(source, "<astra validator>", "exec"), namespace)
+    return namespace["validate"]  # type: ignore[no-any-return]
+
+
+# _location() is copied into the module, so that validating with it does not
+# load the code generator
+_MODULE_HEADER = '''"""
+Validators generated from the ASTRA JSON schemas
+
+Generated by scripts/generate_schemas.py from the definitions in
+_schema_sources.py. Do not edit by hand.
+"""
+
+import re
+from typing import Any, Callable, Dict, Tuple
+
+from .schemas import SchemaValidationError as _Invalid
+
+
+''' + inspect.getsource(_location) + '''
+
+def _fail(path: Tuple[Any, ...], message: str) -> _Invalid:
+    return _Invalid(f"{_location(path)} {message}")
+'''
+
+
+def generate_module(schemas: Mapping[str, Mapping[str, Any]]) -> str:
+    """Generate a module defining a validator for each of the given schemas
+
+    The module defines ``validate_<name>(data)`` for each schema and maps
+    schema names to them in ``VALIDATORS``. Unlike compile_validator(), the
+    result can be shipped with the package, and compiled ahead of time.
+
+    The schemas must embed the same definitions, as the ASTRA schemas do, so
+    that the functions generated for them can be shared between schemas.
+    """
+    roots = list(schemas.values())
+    if any(root.get("definitions") != roots[0].get("definitions") for root in roots):
+        raise ValueError("Schemas must embed the same definitions")
+
+    generator = _Generator(roots[0])
+    entry_points = {
+        name: generator.function(schema, f"#/definitions/{_escape(name)}")
+        for name, schema in schemas.items()
+    }
+
+    parts = [_MODULE_HEADER, "\n\n"]
+    parts.extend(f"{constant} = {source}\n" for constant, source in generator.constants.items())
+    parts.append("\n\n" + generator.source())
+    for name, function in entry_points.items():
+        parts.append(f"def validate_{name}(data: Any) -> None:\n    {function}(data, ())\n\n\n")
+    parts.append("VALIDATORS: Dict[str, Callable[[Any], None]] = {\n")
+    parts.extend(f"    {name!r}: validate_{name},\n" for name in schemas)
+    parts.append("}\n")
+    return "".join(parts)
@@ -0,0 +1,1102 @@
+"""
+Validators generated from the ASTRA JSON schemas
+
+Generated by scripts/generate_schemas.py from the definitions in
+_schema_sources.py. Do not edit by hand.
+"""
+
+import re
+from typing import Any, Callable, Dict, Tuple
+
+from .schemas import SchemaValidationError as _Invalid
+
+
+def _location(path: Tuple[Any, ...]) -> str:
+    """Format an instance path, e.g. data.acts[0].id"""
+    return "data" + "".join(
+        f"[{part}]" if isinstance(part, int) else f".{part}" for part in path
+    )
+
+
+def _fail(path: Tuple[Any, ...], message: str) -> _Invalid:
+    return _Invalid(f"{_location(path)} {message}")
+
+
+_search_3 = re.compile('^act_[a-zA-Z0-9_-]+$').search
+_enum_7 = frozenset(('ask', 'fact', 'confirm', 'commit', 'error'))
+_enum_10 = frozenset(('human', 'speech_recognition', 'text_analysis', 'system', 'ai'))
+_search_15 = re.compile('^[a-z]{2}(-[A-Z]{2})?$').search
+_properties_18 = frozenset(('id', 'timestamp', 'speaker', 'type', 'confidence', 'source', 'metadata'))
+_search_22 = re.compile('^act_[a-zA-Z0-9_-]+$').search
+_enum_28 = frozenset(('human', 'speech_recognition', 'text_analysis', 'system', 'ai'))
+_enum_41 = frozenset(('required', 'optional', 'min_length', 'max_length', 'pattern', 'format', 'range', 'enum', 'custom'))
+_properties_45 = frozenset(('type', 'value', 'message', 'code'))
+_enum_49 = frozenset(('string', 'number', 'boolean', 'object', 'array', 'date', 'email', 'phone', 'address'))
+_properties_52 = frozenset(('id', 'timestamp', 'speaker', 'type', 'confidence', 'source', 'metadata', 'field', 'prompt', 'constraints', 'required', 'expected_type', 'retry_count', 'max_retries'))
+_search_56 = re.compile('^act_[a-zA-Z0-9_-]+$').search
+_enum_62 = frozenset(('human', 'speech_recognition', 'text_analysis', 'system', 'ai'))
+_properties_78 = frozenset(('id', 'type', 'external_id', 'system', 'version', 'schema_url', 'metadata'))
+_enum_83 = frozenset(('set', 'append', 'increment', 'decrement', 'delete', 'merge'))
+_enum_86 = frozenset(('pending', 'valid', 'invalid', 'partial'))
+_properties_90 = frozenset(('id', 'timestamp', 'speaker', 'type', 'confidence', 'source', 'metadata', 'entity', 'field', 'value', 'operation', 'previous_value', 'validation_status', 'validation_errors'))
+_search_94 = re.compile('^act_[a-zA-Z0-9_-]+$').search
+_enum_100 = frozenset(('human', 'speech_recognition', 'text_analysis', 'system', 'ai'))
+_enum_111 = frozenset(('verbal', 'explicit', 'implicit', 'timeout', 'system'))
+_properties_117 = frozenset(('id', 'timestamp', 'speaker', 'type', 'confidence', 'source', 'metadata', 'entity', 'summary', 'awaiting', 'confirmed', 'confirmation_method', 'fields_confirmed', 'rejection_reason', 'timeout_ms'))
+_search_121 = re.compile('^act_[a-zA-Z0-9_-]+$').search
+_enum_127 = frozenset(('human', 'speech_recognition', 'text_analysis', 'system', 'ai'))
+_enum_135 = frozenset(('create', 'update', 'delete', 'execute', 'cancel', 'pause', 'resume'))
+_enum_139 = frozenset(('pending', 'in_progress', 'success', 'failed', 'retrying', 'cancelled'))
+_properties_150 = frozenset(('id', 'timestamp', 'speaker', 'type', 'confidence', 'source', 'metadata', 'entity', 'action', 'system', 'transaction_id', 'status', 'error', 'retry_count', 'max_retries', 'idempotency_key', 'rollback_info'))
+_search_154 = re.compile('^act_[a-zA-Z0-9_-]+$').search
+_enum_160 = frozenset(('human', 'speech_recognition', 'text_analysis', 'system', 'ai'))
+_enum_173 = frozenset(('info', 'warning', 'error', 'critical'))
+_enum_175 = frozenset(('validation', 'processing', 'integration', 'timeout', 'permission', 'system', 'user_input', 'business_rule'))
+_search_180 = re.compile('^act_[a-zA-Z0-9_-]+$').search
+_enum_182 = frozenset(('retry', 'escalate', 'ignore', 'clarify', 'fallback', 'terminate'))
+_properties_185 = frozenset(('id', 'timestamp', 'speaker', 'type', 'confidence', 'source', 'metadata', 'code', 'message', 'recoverable', 'severity', 'category', 'details', 'related_act_id', 'suggested_action', 'user_message', 'stack_trace'))
+_enum_190 = frozenset(('human', 'ai', 'system', 'bot'))
+_properties_210 = frozenset(('id', 'type', 'role', 'name', 'email', 'phone', 'external_id', 'system', 'capabilities', 'permissions', 'preferences', 'metadata'))
+_search_214 = re.compile('^conv_[a-zA-Z0-9_-]+$').search
+_enum_230 = frozenset(('active', 'paused', 'completed', 'failed', 'cancelled'))
+_properties_245 = frozenset(('id', 'participants', 'acts', 'started_at', 'ended_at', 'status', 'channel', 'schema', 'context', 'final_state', 'metadata'))
+
+
+def _validate_14(data: Any, path: Tuple[Any, ...]) -> None:
+    if not (isinstance(data, str)):
+        raise _fail(path, 'must be string')
+    if not _search_15(data):
+        raise _fail(path, "must match pattern '^[a-z]{2}(-[A-Z]{2})?$'")
+
+
+def _validate_1(data: Any, path: Tuple[Any, ...]) -> None:
+    if not (isinstance(data, dict)):
+        raise _fail(path, 'must be object')
+    if 'id' not in data:
+        raise _fail(path, "is missing required property 'id'")
+    if 'timestamp' not in data:
+        raise _fail(path, "is missing required property 'timestamp'")
+    if 'speaker' not in data:
+        raise _fail(path, "is missing required property 'speaker'")
+    if 'type' not in data:
+        raise _fail(path, "is missing required property 'type'")
+    if 'id' in data:
+        value2 = data['id']
+        if not (isinstance(value2, str)):
+            raise _fail(path + ('id',), 'must be string')
+        if not _search_3(value2):
+            raise _fail(path + ('id',), "must match pattern '^act_[a-zA-Z0-9_-]+$'")
+    if 'timestamp' in data:
+        value4 = data['timestamp']
+        if not (isinstance(value4, str)):
+            raise _fail(path + ('timestamp',), 'must be string')
+    if 'speaker' in data:
+        value5 = data['speaker']
+        if not (isinstance(value5, str)):
+            raise _fail(path + ('speaker',), 'must be string')
+    if 'type' in data:
+        value6 = data['type']
+        if not (isinstance(value6, str)):
+            raise _fail(path + ('type',), 'must be string')
+        if value6 not in _enum_7:
+            raise _fail(path + ('type',), "must be one of ['ask', 'fact', 'confirm', 'commit', 'error']")
+    if 'confidence' in data:
+        value8 = data['confidence']
+        if not ((isinstance(value8, (int, float)) and not isinstance(value8, bool))):
+            raise _fail(path + ('confidence',), 'must be number')
+        if value8 < 0.0:
+            raise _fail(path + ('confidence',), 'must be >= 0.0')
+        if value8 > 1.0:
+            raise _fail(path + ('confidence',), 'must be <= 1.0')
+    if 'source' in data:
+        value9 = data['source']
+        if not (isinstance(value9, str)):
+            raise _fail(path + ('source',), 'must be string')
+        if value9 not in _enum_10:
+            raise _fail(path + ('source',), "must be one of ['human', 'speech_recognition', 'text_analysis', 'system', 'ai']")
+    if 'metadata' in data:
+        value11 = data['metadata']
+        if not (isinstance(value11, dict)):
+            raise _fail(path + ('metadata',), 'must be object')
+        if 'channel' in value11:
+            value12 = value11['channel']
+            if not (isinstance(value12, str)):
+                raise _fail(path + ('metadata', 'channel',), 'must be string')
+        if 'language' in value11:
+            value13 = value11['language']
+            _validate_14(value13, path + ('metadata', 'language',))
+        if 'original_text' in value11:
+            value16 = value11['original_text']
+            if not (isinstance(value16, str)):
+                raise _fail(path + ('metadata', 'original_text',), 'must be string')
+        if 'processing_time_ms' in value11:
+            value17 = value11['processing_time_ms']
+            if not ((isinstance(value17, (int, float)) and not isinstance(value17, bool))):
+                raise _fail(path + ('metadata', 'processing_time_ms',), 'must be number')
+            if value17 < 0:
+                raise _fail(path + ('metadata', 'processing_time_ms',), 'must be >= 0')
+    for key19 in data:
+        if key19 not in _properties_18:
+            raise _fail(path, 'has unexpected property %r' % (key19,))
+
+
+def _validate_39(data: Any, path: Tuple[Any, ...]) -> None:
+    if not (isinstance(data, dict)):
+        raise _fail(path, 'must be object')
+    if 'type' not in data:
+        raise _fail(path, "is missing required property 'type'")
+    if 'type' in data:
+        value40 = data['type']
+        if not (isinstance(value40, str)):
+            raise _fail(path + ('type',), 'must be string')
+        if value40 not in _enum_41:
+            raise _fail(path + ('type',), "must be one of ['required', 'optional', 'min_length', 'max_length', 'pattern', 'format', 'range', 'enum', 'custom']")
+    if 'message' in data:
+        value43 = data['message']
+        if not (isinstance(value43, str)):
+            raise _fail(path + ('message',), 'must be string')
+    if 'code' in data:
+        value44 = data['code']
+        if not (isinstance(value44, str)):
+            raise _fail(path + ('code',), 'must be string')
+    for key46 in data:
+        if key46 not in _properties_45:
+            raise _fail(path, 'has unexpected property %r' % (key46,))
+
+
+def _validate_20(data: Any, path: Tuple[Any, ...]) -> None:
+    if not (isinstance(data, dict)):
+        raise _fail(path, 'must be object')
+    if 'id' not in data:
+        raise _fail(path, "is missing required property 'id'")
+    if 'timestamp' not in data:
+        raise _fail(path, "is missing required property 'timestamp'")
+    if 'speaker' not in data:
+        raise _fail(path, "is missing required property 'speaker'")
+    if 'type' not in data:
+        raise _fail(path, "is missing required property 'type'")
+    if 'field' not in data:
+        raise _fail(path, "is missing required property 'field'")
+    if 'prompt' not in data:
+        raise _fail(path, "is missing required property 'prompt'")
+    if 'id' in data:
+        value21 = data['id']
+        if not (isinstance(value21, str)):
+            raise _fail(path + ('id',), 'must be string')
+        if not _search_22(value21):
+            raise _fail(path + ('id',), "must match pattern '^act_[a-zA-Z0-9_-]+$'")
+    if 'timestamp' in data:
+        value23 = data['timestamp']
+        if not (isinstance(value23, str)):
+            raise _fail(path + ('timestamp',), 'must be string')
+    if 'speaker' in data:
+        value24 = data['speaker']
+        if not (isinstance(value24, str)):
+            raise _fail(path + ('speaker',), 'must be string')
+    if 'type' in data:
+        value25 = data['type']
+        if value25 != 'ask':
+            raise _fail(path + ('type',), "must be 'ask'")
+    if 'confidence' in data:
+        value26 = data['confidence']
+        if not ((isinstance(value26, (int, float)) and not isinstance(value26, bool))):
+            raise _fail(path + ('confidence',), 'must be number')
+        if value26 < 0.0:
+            raise _fail(path + ('confidence',), 'must be >= 0.0')
+        if value26 > 1.0:
+            raise _fail(path + ('confidence',), 'must be <= 1.0')
+    if 'source' in data:
+        value27 = data['source']
+        if not (isinstance(value27, str)):
+            raise _fail(path + ('source',), 'must be string')
+        if value27 not in _enum_28:
+            raise _fail(path + ('source',), "must be one of ['human', 'speech_recognition', 'text_analysis', 'system', 'ai']")
+    if 'metadata' in data:
+        value29 = data['metadata']
+        if not (isinstance(value29, dict)):
+            raise _fail(path + ('metadata',), 'must be object')
+        if 'channel' in value29:
+            value30 = value29['channel']
+            if not (isinstance(value30, str)):
+                raise _fail(path + ('metadata', 'channel',), 'must be string')
+        if 'language' in value29:
+            value31 = value29['language']
+            _validate_14(value31, path + ('metadata', 'language',))
+        if 'original_text' in value29:
+            value32 = value29['original_text']
+            if not (isinstance(value32, str)):
+                raise _fail(path + ('metadata', 'original_text',), 'must be string')
+        if 'processing_time_ms' in value29:
+            value33 = value29['processing_time_ms']
+            if not ((isinstance(value33, (int, float)) and not isinstance(value33, bool))):
+                raise _fail(path + ('metadata', 'processing_time_ms',), 'must be number')
+            if value33 < 0:
+                raise _fail(path + ('metadata', 'processing_time_ms',), 'must be >= 0')
+    if 'field' in data:
+        value34 = data['field']
+        if not (isinstance(value34, str)):
+            raise _fail(path + ('field',), 'must be string')
+    if 'prompt' in data:
+        value35 = data['prompt']
+        if not (isinstance(value35, str)):
+            raise _fail(path + ('prompt',), 'must be string')
+    if 'constraints' in data:
+        value36 = data['constraints']
+        if not (isinstance(value36, list)):
+            raise _fail(path + ('constraints',), 'must be array')
+        for index37, item38 in enumerate(value36):
+            _validate_39(item38, path + ('constraints', index37,))
+    if 'required' in data:
+        value47 = data['required']
+        if not (isinstance(value47, bool)):
+            raise _fail(path + ('required',), 'must be boolean')
+    if 'expected_type' in data:
+        value48 = data['expected_type']
+        if not (isinstance(value48, str)):
+            raise _fail(path + ('expected_type',), 'must be string')
+        if value48 not in _enum_49:
+            raise _fail(path + ('expected_type',), "must be one of ['string', 'number', 'boolean', 'object', 'array', 'date', 'email', 'phone', 'address']")
+    if 'retry_count' in data:
+        value50 = data['retry_count']
+        if not ((isinstance(value50, int) and not isinstance(value50, bool) or isinstance(value50, float) and value50.is_integer())):
+            raise _fail(path + ('retry_count',), 'must be integer')
+        if value50 < 0:
+            raise _fail(path + ('retry_count',), 'must be >= 0')
+    if 'max_retries' in data:
+        value51 = data['max_retries']
+        if not ((isinstance(value51, int) and not isinstance(value51, bool) or isinstance(value51, float) and value51.is_integer())):
+            raise _fail(path + ('max_retries',), 'must be integer')
+        if value51 < 0:
+            raise _fail(path + ('max_retries',), 'must be >= 0')
+    for key53 in data:
+        if key53 not in _properties_52:
+            raise _fail(path, 'has unexpected property %r' % (key53,))
+
+
+def _validate_70(data: Any, path: Tuple[Any, ...]) -> None:
+    if not (isinstance(data, dict)):
+        raise _fail(path, 'must be object')
+    if 'id' not in data:
+        raise _fail(path, "is missing required property 'id'")
+    if 'type' not in data:
+        raise _fail(path, "is missing required property 'type'")
+    if 'id' in data:
+        value71 = data['id']
+        if not (isinstance(value71, str)):
+            raise _fail(path + ('id',), 'must be string')
+    if 'type' in data:
+        value72 = data['type']
+        if not (isinstance(value72, str)):
+            raise _fail(path + ('type',), 'must be string')
+    if 'external_id' in data:
+        value73 = data['external_id']
+        if not (isinstance(value73, str)):
+            raise _fail(path + ('external_id',), 'must be string')
+    if 'system' in data:
+        value74 = data['system']
+        if not (isinstance(value74, str)):
+            raise _fail(path + ('system',), 'must be string')
+    if 'version' in data:
+        value75 = data['version']
+        if not (isinstance(value75, str)):
+            raise _fail(path + ('version',), 'must be string')
+    if 'schema_url' in data:
+        value76 = data['schema_url']
+        if not (isinstance(value76, str)):
+            raise _fail(path + ('schema_url',), 'must be string')
+    if 'metadata' in data:
+        value77 = data['metadata']
+        if not (isinstance(value77, dict)):
+            raise _fail(path + ('metadata',), 'must be object')
+    for key79 in data:
+        if key79 not in _properties_78:
+            raise _fail(path, 'has unexpected property %r' % (key79,))
+
+
+def _validate_69(data: Any, path: Tuple[Any, ...]) -> None:
+    if isinstance(data, str):
+        pass
+    else:
+        _validate_70(data, path)
+
+
+def _validate_54(data: Any, path: Tuple[Any, ...]) -> None:
+    if not (isinstance(data, dict)):
+        raise _fail(path, 'must be object')
+    if 'id' not in data:
+        raise _fail(path, "is missing required property 'id'")
+    if 'timestamp' not in data:
+        raise _fail(path, "is missing required property 'timestamp'")
+    if 'speaker' not in data:
+        raise _fail(path, "is missing required property 'speaker'")
+    if 'type' not in data:
+        raise _fail(path, "is missing required property 'type'")
+    if 'entity' not in data:
+        raise _fail(path, "is missing required property 'entity'")
+    if 'field' not in data:
+        raise _fail(path, "is missing required property 'field'")
+    if 'value' not in data:
+        raise _fail(path, "is missing required property 'value'")
+    if 'id' in data:
+        value55 = data['id']
+        if not (isinstance(value55, str)):
+            raise _fail(path + ('id',), 'must be string')
+        if not _search_56(value55):
+            raise _fail(path + ('id',), "must match pattern '^act_[a-zA-Z0-9_-]+$'")
+    if 'timestamp' in data:
+        value57 = data['timestamp']
+        if not (isinstance(value57, str)):
+            raise _fail(path + ('timestamp',), 'must be string')
+    if 'speaker' in data:
+        value58 = data['speaker']
+        if not (isinstance(value58, str)):
+            raise _fail(path + ('speaker',), 'must be string')
+    if 'type' in data:
+        value59 = data['type']
+        if value59 != 'fact':
+            raise _fail(path + ('type',), "must be 'fact'")
+    if 'confidence' in data:
+        value60 = data['confidence']
+        if not ((isinstance(value60, (int, float)) and not isinstance(value60, bool))):
+            raise _fail(path + ('confidence',), 'must be number')
+        if value60 < 0.0:
+            raise _fail(path + ('confidence',), 'must be >= 0.0')
+        if value60 > 1.0:
+            raise _fail(path + ('confidence',), 'must be <= 1.0')
+    if 'source' in data:
+        value61 = data['source']
+        if not (isinstance(value61, str)):
+            raise _fail(path + ('source',), 'must be string')
+        if value61 not in _enum_62:
+            raise _fail(path + ('source',), "must be one of ['human', 'speech_recognition', 'text_analysis', 'system', 'ai']")
+    if 'metadata' in data:
+        value63 = data['metadata']
+        if not (isinstance(value63, dict)):
+            raise _fail(path + ('metadata',), 'must be object')
+        if 'channel' in value63:
+            value64 = value63['channel']
+            if not (isinstance(value64, str)):
+                raise _fail(path + ('metadata', 'channel',), 'must be string')
+        if 'language' in value63:
+            value65 = value63['language']
+            _validate_14(value65, path + ('metadata', 'language',))
+        if 'original_text' in value63:
+            value66 = value63['original_text']
+            if not (isinstance(value66, str)):
+                raise _fail(path + ('metadata', 'original_text',), 'must be string')
+        if 'processing_time_ms' in value63:
+            value67 = value63['processing_time_ms']
+            if not ((isinstance(value67, (int, float)) and not isinstance(value67, bool))):
+                raise _fail(path + ('metadata', 'processing_time_ms',), 'must be number')
+            if value67 < 0:
+                raise _fail(path + ('metadata', 'processing_time_ms',), 'must be >= 0')
+    if 'entity' in data:
+        value68 = data['entity']
+        _validate_69(value68, path + ('entity',))
+    if 'field' in data:
+        value80 = data['field']
+        if not (isinstance(value80, str)):
+            raise _fail(path + ('field',), 'must be string')
+    if 'operation' in data:
+        value82 = data['operation']
+        if not (isinstance(value82, str)):
+            raise _fail(path + ('operation',), 'must be string')
+        if value82 not in _enum_83:
+            raise _fail(path + ('operation',), "must be one of ['set', 'append', 'increment', 'decrement', 'delete', 'merge']")
+    if 'validation_status' in data:
+        value85 = data['validation_status']
+        if not (isinstance(value85, str)):
+            raise _fail(path + ('validation_status',), 'must be string')
+        if value85 not in _enum_86:
+            raise _fail(path + ('validation_status',), "must be one of ['pending', 'valid', 'invalid', 'partial']")
+    if 'validation_errors' in data:
+        value87 = data['validation_errors']
+        if not (isinstance(value87, list)):
+            raise _fail(path + ('validation_errors',), 'must be array')
+        for index88, item89 in enumerate(value87):
+            if not (isinstance(item89, str)):
+                raise _fail(path + ('validation_errors', index88,), 'must be string')
+    for key91 in data:
+        if key91 not in _properties_90:
+            raise _fail(path, 'has unexpected property %r' % (key91,))
+
+
+def _validate_92(data: Any, path: Tuple[Any, ...]) -> None:
+    if not (isinstance(data, dict)):
+        raise _fail(path, 'must be object')
+    if 'id' not in data:
+        raise _fail(path, "is missing required property 'id'")
+    if 'timestamp' not in data:
+        raise _fail(path, "is missing required property 'timestamp'")
+    if 'speaker' not in data:
+        raise _fail(path, "is missing required property 'speaker'")
+    if 'type' not in data:
+        raise _fail(path, "is missing required property 'type'")
+    if 'entity' not in data:
+        raise _fail(path, "is missing required property 'entity'")
+    if 'summary' not in data:
+        raise _fail(path, "is missing required property 'summary'")
+    if 'id' in data:
+        value93 = data['id']
+        if not (isinstance(value93, str)):
+            raise _fail(path + ('id',), 'must be string')
+        if not _search_94(value93):
+            raise _fail(path + ('id',), "must match pattern '^act_[a-zA-Z0-9_-]+$'")
+    if 'timestamp' in data:
+        value95 = data['timestamp']
+        if not (isinstance(value95, str)):
+            raise _fail(path + ('timestamp',), 'must be string')
+    if 'speaker' in data:
+        value96 = data['speaker']
+        if not (isinstance(value96, str)):
+            raise _fail(path + ('speaker',), 'must be string')
+    if 'type' in data:
+        value97 = data['type']
+        if value97 != 'confirm':
+            raise _fail(path + ('type',), "must be 'confirm'")
+    if 'confidence' in data:
+        value98 = data['confidence']
+        if not ((isinstance(value98, (int, float)) and not isinstance(value98, bool))):
+            raise _fail(path + ('confidence',), 'must be number')
+        if value98 < 0.0:
+            raise _fail(path + ('confidence',), 'must be >= 0.0')
+        if value98 > 1.0:
+            raise _fail(path + ('confidence',), 'must be <= 1.0')
+    if 'source' in data:
+        value99 = data['source']
+        if not (isinstance(value99, str)):
+            raise _fail(path + ('source',), 'must be string')
+        if value99 not in _enum_100:
+            raise _fail(path + ('source',), "must be one of ['human', 'speech_recognition', 'text_analysis', 'system', 'ai']")
+    if 'metadata' in data:
+        value101 = data['metadata']
+        if not (isinstance(value101, dict)):
+            raise _fail(path + ('metadata',), 'must be object')
+        if 'channel' in value101:
+            value102 = value101['channel']
+            if not (isinstance(value102, str)):
+                raise _fail(path + ('metadata', 'channel',), 'must be string')
+        if 'language' in value101:
+            value103 = value101['language']
+            _validate_14(value103, path + ('metadata', 'language',))
+        if 'original_text' in value101:
+            value104 = value101['original_text']
+            if not (isinstance(value104, str)):
+                raise _fail(path + ('metadata', 'original_text',), 'must be string')
+        if 'processing_time_ms' in value101:
+            value105 = value101['processing_time_ms']
+            if not ((isinstance(value105, (int, float)) and not isinstance(value105, bool))):
+                raise _fail(path + ('metadata', 'processing_time_ms',), 'must be number')
+            if value105 < 0:
+                raise _fail(path + ('metadata', 'processing_time_ms',), 'must be >= 0')
+    if 'entity' in data:
+        value106 = data['entity']
+        _validate_69(value106, path + ('entity',))
+    if 'summary' in data:
+        value107 = data['summary']
+        if not (isinstance(value107, str)):
+            raise _fail(path + ('summary',), 'must be string')
+    if 'awaiting' in data:
+        value108 = data['awaiting']
+        if not (isinstance(value108, bool)):
+            raise _fail(path + ('awaiting',), 'must be boolean')
+    if 'confirmed' in data:
+        value109 = data['confirmed']
+        if not (isinstance(value109, bool)):
+            raise _fail(path + ('confirmed',), 'must be boolean')
+    if 'confirmation_method' in data:
+        value110 = data['confirmation_method']
+        if not (isinstance(value110, str)):
+            raise _fail(path + ('confirmation_method',), 'must be string')
+        if value110 not in _enum_111:
+            raise _fail(path + ('confirmation_method',), "must be one of ['verbal', 'explicit', 'implicit', 'timeout', 'system']")
+    if 'fields_confirmed' in data:
+        value112 = data['fields_confirmed']
+        if not (isinstance(value112, list)):
+            raise _fail(path + ('fields_confirmed',), 'must be array')
+        for index113, item114 in enumerate(value112):
+            if not (isinstance(item114, str)):
+                raise _fail(path + ('fields_confirmed', index113,), 'must be string')
+    if 'rejection_reason' in data:
+        value115 = data['rejection_reason']
+        if not (isinstance(value115, str)):
+            raise _fail(path + ('rejection_reason',), 'must be string')
+    if 'timeout_ms' in data:
+        value116 = data['timeout_ms']
+        if not ((isinstance(value116, int) and not isinstance(value116, bool) or isinstance(value116, float) and value116.is_integer())):
+            raise _fail(path + ('timeout_ms',), 'must be integer')
+        if value116 < 0:
+            raise _fail(path + ('timeout_ms',), 'must be >= 0')
+    for key118 in data:
+        if key118 not in _properties_117:
+            raise _fail(path, 'has unexpected property %r' % (key118,))
+
+
+def _validate_141(data: Any, path: Tuple[Any, ...]) -> None:
+    if not (isinstance(data, dict)):
+        raise _fail(path, 'must be object')
+    if 'code' not in data:
+        raise _fail(path, "is missing required property 'code'")
+    if 'message' not in data:
+        raise _fail(path, "is missing required property 'message'")
+    if 'code' in data:
+        value142 = data['code']
+        if not (isinstance(value142, str)):
+            raise _fail(path + ('code',), 'must be string')
+    if 'message' in data:
+        value143 = data['message']
+        if not (isinstance(value143, str)):
+            raise _fail(path + ('message',), 'must be string')
+    if 'details' in data:
+        value144 = data['details']
+        if not (isinstance(value144, dict)):
+            raise _fail(path + ('details',), 'must be object')
+    if 'recoverable' in data:
+        value145 = data['recoverable']
+        if not (isinstance(value145, bool)):
+            raise _fail(path + ('recoverable',), 'must be boolean')
+
+
+def _validate_119(data: Any, path: Tuple[Any, ...]) -> None:
+    if not (isinstance(data, dict)):
+        raise _fail(path, 'must be object')
+    if 'id' not in data:
+        raise _fail(path, "is missing required property 'id'")
+    if 'timestamp' not in data:
+        raise _fail(path, "is missing required property 'timestamp'")
+    if 'speaker' not in data:
+        raise _fail(path, "is missing required property 'speaker'")
+    if 'type' not in data:
+        raise _fail(path, "is missing required property 'type'")
+    if 'entity' not in data:
+        raise _fail(path, "is missing required property 'entity'")
+    if 'action' not in data:
+        raise _fail(path, "is missing required property 'action'")
+    if 'id' in data:
+        value120 = data['id']
+        if not (isinstance(value120, str)):
+            raise _fail(path + ('id',), 'must be string')
+        if not _search_121(value120):
+            raise _fail(path + ('id',), "must match pattern '^act_[a-zA-Z0-9_-]+$'")
+    if 'timestamp' in data:
+        value122 = data['timestamp']
+        if not (isinstance(value122, str)):
+            raise _fail(path + ('timestamp',), 'must be string')
+    if 'speaker' in data:
+        value123 = data['speaker']
+        if not (isinstance(value123, str)):
+            raise _fail(path + ('speaker',), 'must be string')
+    if 'type' in data:
+        value124 = data['type']
+        if value124 != 'commit':
+            raise _fail(path + ('type',), "must be 'commit'")
+    if 'confidence' in data:
+        value125 = data['confidence']
+        if not ((isinstance(value125, (int, float)) and not isinstance(value125, bool))):
+            raise _fail(path + ('confidence',), 'must be number')
+        if value125 < 0.0:
+            raise _fail(path + ('confidence',), 'must be >= 0.0')
+        if value125 > 1.0:
+            raise _fail(path + ('confidence',), 'must be <= 1.0')
+    if 'source' in data:
+        value126 = data['source']
+        if not (isinstance(value126, str)):
+            raise _fail(path + ('source',), 'must be string')
+        if value126 not in _enum_127:
+            raise _fail(path + ('source',), "must be one of ['human', 'speech_recognition', 'text_analysis', 'system', 'ai']")
+    if 'metadata' in data:
+        value128 = data['metadata']
+        if not (isinstance(value128, dict)):
+            raise _fail(path + ('metadata',), 'must be object')
+        if 'channel' in value128:
+            value129 = value128['channel']
+            if not (isinstance(value129, str)):
+                raise _fail(path + ('metadata', 'channel',), 'must be string')
+        if 'language' in value128:
+            value130 = value128['language']
+            _validate_14(value130, path + ('metadata', 'language',))
+        if 'original_text' in value128:
+            value131 = value128['original_text']
+            if not (isinstance(value131, str)):
+                raise _fail(path + ('metadata', 'original_text',), 'must be string')
+        if 'processing_time_ms' in value128:
+            value132 = value128['processing_time_ms']
+            if not ((isinstance(value132, (int, float)) and not isinstance(value132, bool))):
+                raise _fail(path + ('metadata', 'processing_time_ms',), 'must be number')
+            if value132 < 0:
+                raise _fail(path + ('metadata', 'processing_time_ms',), 'must be >= 0')
+    if 'entity' in data:
+        value133 = data['entity']
+        _validate_69(value133, path + ('entity',))
+    if 'action' in data:
+        value134 = data['action']
+        if not (isinstance(value134, str)):
+            raise _fail(path + ('action',), 'must be string')
+        if value134 not in _enum_135:
+            raise _fail(path + ('action',), "must be one of ['create', 'update', 'delete', 'execute', 'cancel', 'pause', 'resume']")
+    if 'system' in data:
+        value136 = data['system']
+        if not (isinstance(value136, str)):
+            raise _fail(path + ('system',), 'must be string')
+    if 'transaction_id' in data:
+        value137 = data['transaction_id']
+        if not (isinstance(value137, str)):
+            raise _fail(path + ('transaction_id',), 'must be string')
+    if 'status' in data:
+        value138 = data['status']
+        if not (isinstance(value138, str)):
+            raise _fail(path + ('status',), 'must be string')
+        if value138 not in _enum_139:
+            raise _fail(path + ('status',), "must be one of ['pending', 'in_progress', 'success', 'failed', 'retrying', 'cancelled']")
+    if 'error' in data:
+        value140 = data['error']
+        _validate_141(value140, path + ('error',))
+    if 'retry_count' in data:
+        value146 = data['retry_count']
+        if not ((isinstance(value146, int) and not isinstance(value146, bool) or isinstance(value146, float) and value146.is_integer())):
+            raise _fail(path + ('retry_count',), 'must be integer')
+        if value146 < 0:
+            raise _fail(path + ('retry_count',), 'must be >= 0')
+    if 'max_retries' in data:
+        value147 = data['max_retries']
+        if not ((isinstance(value147, int) and not isinstance(value147, bool) or isinstance(value147, float) and value147.is_integer())):
+            raise _fail(path + ('max_retries',), 'must be integer')
+        if value147 < 0:
+            raise _fail(path + ('max_retries',), 'must be >= 0')
+    if 'idempotency_key' in data:
+        value148 = data['idempotency_key']
+        if not (isinstance(value148, str)):
+            raise _fail(path + ('idempotency_key',), 'must be string')
+    if 'rollback_info' in data:
+        value149 = data['rollback_info']
+        if not (isinstance(value149, dict)):
+            raise _fail(path + ('rollback_info',), 'must be object')
+    for key151 in data:
+        if key151 not in _properties_150:
+            raise _fail(path, 'has unexpected property %r' % (key151,))
+
+
+def _validate_167(data: Any, path: Tuple[Any, ...]) -> None:
+    if not (isinstance(data, str)):
+        raise _fail(path, 'must be string')
+
+
+def _validate_169(data: Any, path: Tuple[Any, ...]) -> None:
+    if not (isinstance(data, str)):
+        raise _fail(path, 'must be string')
+
+
+def _validate_171(data: Any, path: Tuple[Any, ...]) -> None:
+    if not (isinstance(data, bool)):
+        raise _fail(path, 'must be boolean')
+
+
+def _validate_177(data: Any, path: Tuple[Any, ...]) -> None:
+    if not (isinstance(data, dict)):
+        raise _fail(path, 'must be object')
+
+
+def _validate_179(data: Any, path: Tuple[Any, ...]) -> None:
+    if not (isinstance(data, str)):
+        raise _fail(path, 'must be string')
+    if not _search_180(data):
+        raise _fail(path, "must match pattern '^act_[a-zA-Z0-9_-]+$'")
+
+
+def _validate_152(data: Any, path: Tuple[Any, ...]) -> None:
+    if not (isinstance(data, dict)):
+        raise _fail(path, 'must be object')
+    if 'id' not in data:
+        raise _fail(path, "is missing required property 'id'")
+    if 'timestamp' not in data:
+        raise _fail(path, "is missing required property 'timestamp'")
+    if 'speaker' not in data:
+        raise _fail(path, "is missing required property 'speaker'")
+    if 'type' not in data:
+        raise _fail(path, "is missing required property 'type'")
+    if 'code' not in data:
+        raise _fail(path, "is missing required property 'code'")
+    if 'message' not in data:
+        raise _fail(path, "is missing required property 'message'")
+    if 'recoverable' not in data:
+        raise _fail(path, "is missing required property 'recoverable'")
+    if 'id' in data:
+        value153 = data['id']
+        if not (isinstance(value153, str)):
+            raise _fail(path + ('id',), 'must be string')
+        if not _search_154(value153):
+            raise _fail(path + ('id',), "must match pattern '^act_[a-zA-Z0-9_-]+$'")
+    if 'timestamp' in data:
+        value155 = data['timestamp']
+        if not (isinstance(value155, str)):
+            raise _fail(path + ('timestamp',), 'must be string')
+    if 'speaker' in data:
+        value156 = data['speaker']
+        if not (isinstance(value156, str)):
+            raise _fail(path + ('speaker',), 'must be string')
+    if 'type' in data:
+        value157 = data['type']
+        if value157 != 'error':
+            raise _fail(path + ('type',), "must be 'error'")
+    if 'confidence' in data:
+        value158 = data['confidence']
+        if not ((isinstance(value158, (int, float)) and not isinstance(value158, bool))):
+            raise _fail(path + ('confidence',), 'must be number')
+        if value158 < 0.0:
+            raise _fail(path + ('confidence',), 'must be >= 0.0')
+        if value158 > 1.0:
+            raise _fail(path + ('confidence',), 'must be <= 1.0')
+    if 'source' in data:
+        value159 = data['source']
+        if not (isinstance(value159, str)):
+            raise _fail(path + ('source',), 'must be string')
+        if value159 not in _enum_160:
+            raise _fail(path + ('source',), "must be one of ['human', 'speech_recognition', 'text_analysis', 'system', 'ai']")
+    if 'metadata' in data:
+        value161 = data['metadata']
+        if not (isinstance(value161, dict)):
+            raise _fail(path + ('metadata',), 'must be object')
+        if 'channel' in value161:
+            value162 = value161['channel']
+            if not (isinstance(value162, str)):
+                raise _fail(path + ('metadata', 'channel',), 'must be string')
+        if 'language' in value161:
+            value163 = value161['language']
+            _validate_14(value163, path + ('metadata', 'language',))
+        if 'original_text' in value161:
+            value164 = value161['original_text']
+            if not (isinstance(value164, str)):
+                raise _fail(path + ('metadata', 'original_text',), 'must be string')
+        if 'processing_time_ms' in value161:
+            value165 = value161['processing_time_ms']
+            if not ((isinstance(value165, (int, float)) and not isinstance(value165, bool))):
+                raise _fail(path + ('metadata', 'processing_time_ms',), 'must be number')
+            if value165 < 0:
+                raise _fail(path + ('metadata', 'processing_time_ms',), 'must be >= 0')
+    if 'code' in data:
+        value166 = data['code']
+        _validate_167(value166, path + ('code',))
+    if 'message' in data:
+        value168 = data['message']
+        _validate_169(value168, path + ('message',))
+    if 'recoverable' in data:
+        value170 = data['recoverable']
+        _validate_171(value170, path + ('recoverable',))
+    if 'severity' in data:
+        value172 = data['severity']
+        if not (isinstance(value172, str)):
+            raise _fail(path + ('severity',), 'must be string')
+        if value172 not in _enum_173:
+            raise _fail(path + ('severity',), "must be one of ['info', 'warning', 'error', 'critical']")
+    if 'category' in data:
+        value174 = data['category']
+        if not (isinstance(value174, str)):
+            raise _fail(path + ('category',), 'must be string')
+        if value174 not in _enum_175:
+            raise _fail(path + ('category',), "must be one of ['validation', 'processing', 'integration', 'timeout', 'permission', 'system', 'user_input', 'business_rule']")
+    if 'details' in data:
+        value176 = data['details']
+        _validate_177(value176, path + ('details',))
+    if 'related_act_id' in data:
+        value178 = data['related_act_id']
+        _validate_179(value178, path + ('related_act_id',))
+    if 'suggested_action' in data:
+        value181 = data['suggested_action']
+        if not (isinstance(value181, str)):
+            raise _fail(path + ('suggested_action',), 'must be string')
+        if value181 not in _enum_182:
+            raise _fail(path + ('suggested_action',), "must be one of ['retry', 'escalate', 'ignore', 'clarify', 'fallback', 'terminate']")
+    if 'user_message' in data:
+        value183 = data['user_message']
+        if not (isinstance(value183, str)):
+            raise _fail(path + ('user_message',), 'must be string')
+    if 'stack_trace' in data:
+        value184 = data['stack_trace']
+        if not (isinstance(value184, str)):
+            raise _fail(path + ('stack_trace',), 'must be string')
+    for key186 in data:
+        if key186 not in _properties_185:
+            raise _fail(path, 'has unexpected property %r' % (key186,))
+
+
+def _validate_187(data: Any, path: Tuple[Any, ...]) -> None:
+    if not (isinstance(data, dict)):
+        raise _fail(path, 'must be object')
+    if 'id' not in data:
+        raise _fail(path, "is missing required property 'id'")
+    if 'type' not in data:
+        raise _fail(path, "is missing required property 'type'")
+    if 'id' in data:
+        value188 = data['id']
+        if not (isinstance(value188, str)):
+            raise _fail(path + ('id',), 'must be string')
+    if 'type' in data:
+        value189 = data['type']
+        if not (isinstance(value189, str)):
+            raise _fail(path + ('type',), 'must be string')
+        if value189 not in _enum_190:
+            raise _fail(path + ('type',), "must be one of ['human', 'ai', 'system', 'bot']")
+    if 'role' in data:
+        value191 = data['role']
+        if not (isinstance(value191, str)):
+            raise _fail(path + ('role',), 'must be string')
+    if 'name' in data:
+        value192 = data['name']
+        if not (isinstance(value192, str)):
+            raise _fail(path + ('name',), 'must be string')
+    if 'email' in data:
+        value193 = data['email']
+        if not (isinstance(value193, str)):
+            raise _fail(path + ('email',), 'must be string')
+    if 'phone' in data:
+        value194 = data['phone']
+        if not (isinstance(value194, str)):
+            raise _fail(path + ('phone',), 'must be string')
+    if 'external_id' in data:
+        value195 = data['external_id']
+        if not (isinstance(value195, str)):
+            raise _fail(path + ('external_id',), 'must be string')
+    if 'system' in data:
+        value196 = data['system']
+        if not (isinstance(value196, str)):
+            raise _fail(path + ('system',), 'must be string')
+    if 'capabilities' in data:
+        value197 = data['capabilities']
+        if not (isinstance(value197, list)):
+            raise _fail(path + ('capabilities',), 'must be array')
+        for index198, item199 in enumerate(value197):
+            if not (isinstance(item199, str)):
+                raise _fail(path + ('capabilities', index198,), 'must be string')
+    if 'permissions' in data:
+        value200 = data['permissions']
+        if not (isinstance(value200, list)):
+            raise _fail(path + ('permissions',), 'must be array')
+        for index201, item202 in enumerate(value200):
+            if not (isinstance(item202, str)):
+                raise _fail(path + ('permissions', index201,), 'must be string')
+    if 'preferences' in data:
+        value203 = data['preferences']
+        if not (isinstance(value203, dict)):
+            raise _fail(path + ('preferences',), 'must be object')
+        if 'language' in value203:
+            value204 = value203['language']
+            _validate_14(value204, path + ('preferences', 'language',))
+        if 'timezone' in value203:
+            value205 = value203['timezone']
+            if not (isinstance(value205, str)):
+                raise _fail(path + ('preferences', 'timezone',), 'must be string')
+        if 'communication_channels' in value203:
+            value206 = value203['communication_channels']
+            if not (isinstance(value206, list)):
+                raise _fail(path + ('preferences', 'communication_channels',), 'must be array')
+            for index207, item208 in enumerate(value206):
+                if not (isinstance(item208, str)):
+                    raise _fail(path + ('preferences', 'communication_channels', index207,), 'must be string')
+    if 'metadata' in data:
+        value209 = data['metadata']
+        if not (isinstance(value209, dict)):
+            raise _fail(path + ('metadata',), 'must be object')
+    for key211 in data:
+        if key211 not in _properties_210:
+            raise _fail(path, 'has unexpected property %r' % (key211,))
+
+
+def _validate_222(data: Any, path: Tuple[Any, ...]) -> None:
+    _validate_20(data, path)
+
+
+def _validate_223(data: Any, path: Tuple[Any, ...]) -> None:
+    _validate_54(data, path)
+
+
+def _validate_224(data: Any, path: Tuple[Any, ...]) -> None:
+    _validate_92(data, path)
+
+
+def _validate_225(data: Any, path: Tuple[Any, ...]) -> None:
+    _validate_119(data, path)
+
+
+def _validate_226(data: Any, path: Tuple[Any, ...]) -> None:
+    _validate_152(data, path)
+
+
+def _validate_212(data: Any, path: Tuple[Any, ...]) -> None:
+    if not (isinstance(data, dict)):
+        raise _fail(path, 'must be object')
+    if 'id' not in data:
+        raise _fail(path, "is missing required property 'id'")
+    if 'participants' not in data:
+        raise _fail(path, "is missing required property 'participants'")
+    if 'acts' not in data:
+        raise _fail(path, "is missing required property 'acts'")
+    if 'id' in data:
+        value213 = data['id']
+        if not (isinstance(value213, str)):
+            raise _fail(path + ('id',), 'must be string')
+        if not _search_214(value213):
+            raise _fail(path + ('id',), "must match pattern '^conv_[a-zA-Z0-9_-]+$'")
+    if 'participants' in data:
+        value215 = data['participants']
+        if not (isinstance(value215, list)):
+            raise _fail(path + ('participants',), 'must be array')
+        if len(value215) < 1:
+            raise _fail(path + ('participants',), 'must contain at least 1 items')
+        for index216, item217 in enumerate(value215):
+            _validate_187(item217, path + ('participants', index216,))
+    if 'acts' in data:
+        value218 = data['acts']
+        if not (isinstance(value218, list)):
+            raise _fail(path + ('acts',), 'must be array')
+        for index219, item220 in enumerate(value218):
+            tag221 = item220.get('type') if isinstance(item220, dict) else None
+            if tag221 == 'ask':
+                _validate_222(item220, path + ('acts', index219,))
+            elif tag221 == 'fact':
+                _validate_223(item220, path + ('acts', index219,))
+            elif tag221 == 'confirm':
+                _validate_224(item220, path + ('acts', index219,))
+            elif tag221 == 'commit':
+                _validate_225(item220, path + ('acts', index219,))
+            elif tag221 == 'error':
+                _validate_226(item220, path + ('acts', index219,))
+            else:
+                raise _fail(path + ('acts', index219,), 'must match exactly one schema in oneOf (matched 0)')
+    if 'started_at' in data:
+        value227 = data['started_at']
+        if not (isinstance(value227, str)):
+            raise _fail(path + ('started_at',), 'must be string')
+    if 'ended_at' in data:
+        value228 = data['ended_at']
+        if not (isinstance(value228, str)):
+            raise _fail(path + ('ended_at',), 'must be string')
+    if 'status' in data:
+        value229 = data['status']
+        if not (isinstance(value229, str)):
+            raise _fail(path + ('status',), 'must be string')
+        if value229 not in _enum_230:
+            raise _fail(path + ('status',), "must be one of ['active', 'paused', 'completed', 'failed', 'cancelled']")
+    if 'channel' in data:
+        value231 = data['channel']
+        if not (isinstance(value231, str)):
+            raise _fail(path + ('channel',), 'must be string')
+    if 'schema' in data:
+        value232 = data['schema']
+        if not (isinstance(value232, str)):
+            raise _fail(path + ('schema',), 'must be string')
+    if 'context' in data:
+        value233 = data['context']
+        if not (isinstance(value233, dict)):
+            raise _fail(path + ('context',), 'must be object')
+        if 'session_id' in value233:
+            value234 = value233['session_id']
+            if not (isinstance(value234, str)):
+                raise _fail(path + ('context', 'session_id',), 'must be string')
+        if 'user_agent' in value233:
+            value235 = value233['user_agent']
+            if not (isinstance(value235, str)):
+                raise _fail(path + ('context', 'user_agent',), 'must be string')
+        if 'ip_address' in value233:
+            value236 = value233['ip_address']
+            if not (isinstance(value236, str)):
+                raise _fail(path + ('context', 'ip_address',), 'must be string')
+        if 'referrer' in value233:
+            value237 = value233['referrer']
+            if not (isinstance(value237, str)):
+                raise _fail(path + ('context', 'referrer',), 'must be string')
+    if 'final_state' in data:
+        value238 = data['final_state']
+        if not (isinstance(value238, dict)):
+            raise _fail(path + ('final_state',), 'must be object')
+    if 'metadata' in data:
+        value239 = data['metadata']
+        if not (isinstance(value239, dict)):
+            raise _fail(path + ('metadata',), 'must be object')
+        if 'total_duration_ms' in value239:
+            value240 = value239['total_duration_ms']
+            if not ((isinstance(value240, int) and not isinstance(value240, bool) or isinstance(value240, float) and value240.is_integer())):
+                raise _fail(path + ('metadata', 'total_duration_ms',), 'must be integer')
+            if value240 < 0:
+                raise _fail(path + ('metadata', 'total_duration_ms',), 'must be >= 0')
+        if 'act_count' in value239:
+            value241 = value239['act_count']
+            if not ((isinstance(value241, int) and not isinstance(value241, bool) or isinstance(value241, float) and value241.is_integer())):
+                raise _fail(path + ('metadata', 'act_count',), 'must be integer')
+            if value241 < 0:
+                raise _fail(path + ('metadata', 'act_count',), 'must be >= 0')
+        if 'error_count' in value239:
+            value242 = value239['error_count']
+            if not ((isinstance(value242, int) and not isinstance(value242, bool) or isinstance(value242, float) and value242.is_integer())):
+                raise _fail(path + ('metadata', 'error_count',), 'must be integer')
+            if value242 < 0:
+                raise _fail(path + ('metadata', 'error_count',), 'must be >= 0')
+        if 'commit_count' in value239:
+            value243 = value239['commit_count']
+            if not ((isinstance(value243, int) and not isinstance(value243, bool) or isinstance(value243, float) and value243.is_integer())):
+                raise _fail(path + ('metadata', 'commit_count',), 'must be integer')
+            if value243 < 0:
+                raise _fail(path + ('metadata', 'commit_count',), 'must be >= 0')
+        if 'avg_confidence' in value239:
+            value244 = value239['avg_confidence']
+            if not ((isinstance(value244, (int, float)) and not isinstance(value244, bool))):
+                raise _fail(path + ('metadata', 'avg_confidence',), 'must be number')
+            if value244 < 0.0:
+                raise _fail(path + ('metadata', 'avg_confidence',), 'must be >= 0.0')
+            if value244 > 1.0:
+                raise _fail(path + ('metadata', 'avg_confidence',), 'must be <= 1.0')
+    for key246 in data:
+        if key246 not in _properties_245:
+            raise _fail(path, 'has unexpected property %r' % (key246,))
+
+def validate_act(data: Any) -> None:
+    _validate_1(data, ())
+
+
+def validate_ask(data: Any) -> None:
+    _validate_20(data, ())
+
+
+def validate_fact(data: Any) -> None:
+    _validate_54(data, ())
+
+
+def validate_confirm(data: Any) -> None:
+    _validate_92(data, ())
+
+
+def validate_commit(data: Any) -> None:
+    _validate_119(data, ())
+
+
+def validate_error(data: Any) -> None:
+    _validate_152(data, ())
+
+
+def validate_entity(data: Any) -> None:
+    _validate_70(data, ())
+
+
+def validate_participant(data: Any) -> None:
+    _validate_187(data, ())
+
+
+def validate_constraint(data: Any) -> None:
+    _validate_39(data, ())
+
+
+def validate_conversation(data: Any) -> None:
+    _validate_212(data, ())
+
+
+VALIDATORS: Dict[str, Callable[[Any], None]] = {
+    'act': validate_act,
+    'ask': validate_ask,
+    'fact': validate_fact,
+    'confirm': validate_confirm,
+    'commit': validate_commit,
+    'error': validate_error,
+    'entity': validate_entity,
+    'participant': validate_participant,
+    'constraint': validate_constraint,
+    'conversation': validate_conversation,
+}
@@ -4,11 +4,49 @@ ASTRA (Act State Representation Architecture) Python Types
 Core types for representing conversational state as typed, auditable sequences of actions.
 """
 
-import uuid
-from datetime import datetime
-from typing import Any, Dict, List, Literal, Optional, Union
-from pydantic import BaseModel, Field, ConfigDict, model_validator
+import importlib
+import json
+import math
+import os
+import re
+import sys
+import time
+from array import array
+from collections import OrderedDict
+from typing import (
+    Any,
+    Dict,
+    IO,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    overload,
+)
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, model_validator
 from enum import Enum
+from types import ModuleType
+
+if sys.version_info >= (3, 9):
+    from typing import Annotated
+else:  # pragma: no cover
+    from typing_extensions import Annotated
+
+
+def _optional_import(name: str) -> Optional[ModuleType]:
+    """Import an optional dependency, or return None if it is not installed"""
+    try:
+        return importlib.import_module(name)
+    except ImportError:  # pragma: no cover
+        return None
+
+
+orjson = _optional_import("orjson")
+ijson = _optional_import("ijson")
 
 # ============================================================================
 # Base Types
@@ -34,7 +72,7 @@ class ActType(str, Enum):
 
 class ActMetadata(BaseModel):
     """Additional metadata for acts"""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
     
     channel: Optional[str] = Field(None, description="Communication channel (voice, text, email, etc.)")
     language: Optional[str] = Field(None, pattern=r"^[a-z]{2}(-[A-Z]{2})?$", description="Language code (ISO 639-1, optional region)")
@@ -44,7 +82,7 @@ class ActMetadata(BaseModel):
 
 class Act(BaseModel):
     """Base type for all conversational actions in ASTRA"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
     
     id: str = Field(..., pattern=r"^act_[a-zA-Z0-9_-]+$", description="Unique identifier for this act within the conversation")
     timestamp: str = Field(..., description="ISO 8601 timestamp when the act occurred")
@@ -61,7 +99,7 @@ class Act(BaseModel):
 
 class Entity(BaseModel):
     """Reference to a business entity in ASTRA conversations"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
     
     id: str = Field(..., description="Unique identifier for this entity within the conversation scope")
     type: str = Field(..., description="Type of business entity (order, customer, appointment, ticket, etc.)")
@@ -108,7 +146,7 @@ class FormatType(str, Enum):
 
 class RangeConstraint(BaseModel):
     """Range constraint value"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
     
     min: Optional[float] = Field(None, description="Minimum value")
     max: Optional[float] = Field(None, description="Maximum value")
@@ -117,7 +155,7 @@ class RangeConstraint(BaseModel):
 
 class Constraint(BaseModel):
     """Validation constraint for ASTRA fields and values"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
     
     type: ConstraintType = Field(..., description="Type of constraint being applied")
     value: Optional[Union[int, str, FormatType, RangeConstraint, List[str]]] = Field(None, description="Constraint value (varies by constraint type)")
@@ -139,7 +177,7 @@ class ParticipantType(str, Enum):
 
 class ParticipantPreferences(BaseModel):
     """Participant preferences"""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
     
     language: Optional[str] = Field(None, pattern=r"^[a-z]{2}(-[A-Z]{2})?$", description="Preferred language code (ISO 639-1 with optional region)")
     timezone: Optional[str] = Field(None, description="Preferred timezone (IANA timezone identifier)")
@@ -148,7 +186,7 @@ class ParticipantPreferences(BaseModel):
 
 class Participant(BaseModel):
     """Conversation participant in ASTRA conversations"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
     
     id: str = Field(..., description="Unique identifier for this participant")
     type: ParticipantType = Field(..., description="Type of participant")
@@ -271,7 +309,7 @@ class CommitStatus(str, Enum):
 
 class CommitError(BaseModel):
     """Error information for failed commits"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
     
     code: str = Field(..., description="Error code from the target system")
     message: str = Field(..., description="Human-readable error message")
@@ -348,6 +386,10 @@ class Error(Act):
 # Union type for all possible acts
 ConversationAct = Union[Ask, Fact, Confirm, Commit, Error]
 
+# Act union tagged by the "type" field, so validation goes straight to the
+# matching model instead of trying each one in turn
+_TaggedAct = Annotated[ConversationAct, Field(discriminator="type")]
+
 
 class ConversationStatus(str, Enum):
     """Current status of the conversation"""
@@ -360,7 +402,7 @@ class ConversationStatus(str, Enum):
 
 class ConversationContext(BaseModel):
     """Conversation context and session information"""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
     
     session_id: Optional[str] = Field(None, description="Session identifier")
     user_agent: Optional[str] = Field(None, description="User agent or client information")
@@ -370,7 +412,7 @@ class ConversationContext(BaseModel):
 
 class ConversationMetadata(BaseModel):
     """Additional conversation metadata"""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
     
     total_duration_ms: Optional[int] = Field(None, ge=0, description="Total conversation duration in milliseconds")
     act_count: Optional[int] = Field(None, ge=0, description="Total number of acts in the conversation")
@@ -379,39 +421,360 @@ class ConversationMetadata(BaseModel):
     avg_confidence: Optional[float] = Field(None, ge=0.0, le=1.0, description="Average confidence score across all acts")
 
 
+# Running totals behind ConversationMetadata: the act, error and successful
+# commit counts, and the sum and number of confidence scores
+_ActTotals = Tuple[int, int, int, float, int]
+_NO_ACTS: _ActTotals = (0, 0, 0, 0.0, 0)
+
+
+def _add_acts(totals: _ActTotals, acts: Sequence[Act]) -> _ActTotals:
+    """Fold acts into running totals"""
+    act_count, error_count, commit_count, confidence_total, confidence_count = totals
+    for act in acts:
+        if act.type == ActType.ERROR:
+            error_count += 1
+        elif act.type == ActType.COMMIT and act.status == CommitStatus.SUCCESS:  # type: ignore[attr-defined]
+            commit_count += 1
+        if act.confidence is not None:
+            confidence_total += act.confidence
+            confidence_count += 1
+    return (
+        act_count + len(acts), error_count, commit_count, confidence_total, confidence_count
+    )
+
+
+def _metadata(conversation: "Conversation", totals: _ActTotals) -> ConversationMetadata:
+    """Metadata of a conversation with the given act totals"""
+    act_count, error_count, commit_count, confidence_total, confidence_count = totals
+    metadata = conversation.metadata
+    return ConversationMetadata(
+        total_duration_ms=metadata.total_duration_ms if metadata else None,
+        act_count=act_count,
+        error_count=error_count,
+        commit_count=commit_count,
+        avg_confidence=confidence_total / confidence_count if confidence_count else None,
+    )
+
+
 class Conversation(BaseModel):
     """Complete ASTRA conversation container with acts and metadata"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
     
     id: str = Field(..., pattern=r"^conv_[a-zA-Z0-9_-]+$", description="Unique identifier for this conversation")
     participants: List[Participant] = Field(..., min_length=1, description="List of conversation participants")
-    acts: List[ConversationAct] = Field(..., description="Ordered sequence of acts in this conversation")
+    acts: List[_TaggedAct] = Field(..., description="Ordered sequence of acts in this conversation")
     started_at: Optional[str] = Field(None, description="When the conversation started")
     ended_at: Optional[str] = Field(None, description="When the conversation ended")
     status: ConversationStatus = Field(ConversationStatus.ACTIVE, description="Current status of the conversation")
     channel: Optional[str] = Field(None, description="Primary communication channel for this conversation")
-    schema: Optional[str] = Field(None, description="Business schema identifier used for this conversation")
+    schema: Optional[str] = Field(None, description="Business schema identifier used for this conversation")  # type: ignore[assignment]
     context: Optional[ConversationContext] = Field(None, description="Conversation context and session information")
     final_state: Optional[Dict[str, Any]] = Field(None, description="Final computed state of all entities after processing all acts")
     metadata: Optional[ConversationMetadata] = Field(None, description="Additional conversation metadata")
 
+    @classmethod
+    def model_validate_json_lazy(cls, json_data: Union[str, bytes]) -> "LazyConversation":
+        """Parse a conversation without validating its acts up front
+
+        See LazyConversation for when each part of the conversation is validated.
+        """
+        data = orjson.loads(json_data) if orjson is not None else json.loads(json_data)
+        if not isinstance(data, dict):
+            raise ValueError("Conversation JSON must be an object")
+        return LazyConversation(data)
+
+    def compute_metadata(self) -> ConversationMetadata:
+        """Compute the act counts and average confidence in a single pass over the acts
+
+        The total duration is not derived from the acts and is carried over
+        from the current metadata, if any.
+        """
+        return _metadata(self, _add_acts(_NO_ACTS, self.acts))
+
+    def act_columns(self) -> "ActColumns":
+        """Copy the acts' type, confidence and speaker into columns for bulk scans
+
+        The columns are a snapshot: build them again after changing the acts.
+        """
+        return ActColumns(self.acts)
+
+
+class LazyActs(Sequence[Act]):
+    """Read-only sequence of acts that validates each act on first access"""
+
+    def __init__(self, raw_acts: List[Any]) -> None:
+        self._raw = raw_acts
+        self._acts: List[Optional[Act]] = [None] * len(raw_acts)
+
+    def _validate(self, index: int) -> Act:
+        act = self._acts[index]
+        if act is None:
+            raw = self._raw[index]
+            act_type = raw.get("type") if isinstance(raw, dict) else None
+            model = _ACT_MODELS_BY_TYPE.get(act_type) if isinstance(act_type, str) else None
+            if model is not None:
+                act = model.model_validate(raw)
+            else:
+                # Not an object with a known type: raises the same error as
+                # validating the conversation eagerly
+                act = _act_adapter().validate_python(raw)
+            self._acts[index] = act
+        return act
+
+    @overload
+    def __getitem__(self, index: int) -> Act: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Act]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Act, List[Act]]:
+        if isinstance(index, slice):
+            return [self._validate(i) for i in range(*index.indices(len(self._raw)))]
+        return self._validate(range(len(self._raw))[index])
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+
+# Open-ended conversation fields, often large and rarely read, that
+# LazyConversation validates only when they are read themselves
+_DEFERRED_FIELDS = frozenset({"final_state", "context", "metadata"})
+
+
+class LazyConversation:
+    """Conversation parsed from JSON with validation deferred until access
+
+    Acts are validated one at a time as they are read from ``acts``.
+    ``final_state``, ``context`` and ``metadata`` are each validated when
+    read. All other fields are validated together the first time any field
+    is read. ``raw_acts`` holds the unvalidated act dicts, for callers that
+    only need a key or two from each act, e.g. ``act["type"]``.
+
+    Only the fields can be read. Use to_conversation() for the model's
+    methods, such as compute_metadata() or model_dump(), which need every
+    act and field.
+    """
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        acts = data.get("acts")
+        if not isinstance(acts, list):
+            raise ValueError("Conversation JSON must have an acts array")
+        self._data = data
+        self._fields: Optional[Conversation] = None
+        self._deferred = set(_DEFERRED_FIELDS.intersection(data))
+        self.raw_acts: List[Dict[str, Any]] = acts
+        self.acts = LazyActs(self.raw_acts)
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in Conversation.model_fields:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        if self._fields is None:
+            fields = {
+                key: value for key, value in self._data.items()
+                if key not in _DEFERRED_FIELDS
+            }
+            self._fields = Conversation.model_validate({**fields, "acts": []})
+        if name in self._deferred:
+            Conversation.__pydantic_validator__.validate_assignment(
+                self._fields, name, self._data[name]
+            )
+            self._deferred.discard(name)
+        return getattr(self._fields, name)
+
+    def to_conversation(self) -> Conversation:
+        """Validate the whole conversation, including every act"""
+        return Conversation.model_validate(self._data)
+
+
+# One-byte code of each act type in ActColumns.types
+_ACT_TYPE_CODES: Dict[ActType, int] = {act_type: code for code, act_type in enumerate(ActType)}
+
+
+class ActColumns:
+    """Column-wise copy of the act fields that analytical scans read
+
+    Each column holds one entry per act, in order: ``types`` one byte per act
+    (see code()), ``confidences`` a float per act with NaN where the act has
+    no confidence, and ``speakers`` the speaker IDs. Counting or summing over
+    a column runs in C instead of touching every act model.
+    """
+
+    __slots__ = ("types", "confidences", "speakers")
+
+    def __init__(self, acts: Sequence[Act]) -> None:
+        self.types = bytes([_ACT_TYPE_CODES[act.type] for act in acts])
+        self.confidences = array(
+            "d", [math.nan if act.confidence is None else act.confidence for act in acts]
+        )
+        self.speakers = [act.speaker for act in acts]
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    @staticmethod
+    def code(act_type: ActType) -> int:
+        """Byte representing an act type in the types column"""
+        return _ACT_TYPE_CODES[act_type]
+
+    def count(self, act_type: ActType) -> int:
+        """Number of acts of the given type"""
+        return self.types.count(_ACT_TYPE_CODES[act_type])
+
+
+class ConversationCache:
+    """Act totals of conversations that grow by appending acts
+
+    The totals are cached under the conversation ID and the sequence of act
+    IDs they were computed from. Computing the metadata of a conversation
+    again after acts were appended only folds in the new acts. Acts are
+    assumed not to change once their ID has been seen, as in an append-only
+    act log.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self._maxsize = maxsize
+        # Hash of a conversation ID and act ID prefix -> (conversation ID,
+        # act IDs, totals), least recently used first
+        self._totals: "OrderedDict[int, Tuple[str, Tuple[str, ...], _ActTotals]]" = OrderedDict()
+
+    def compute_metadata(self, conversation: Conversation) -> ConversationMetadata:
+        """Same as Conversation.compute_metadata(), reusing the longest cached prefix"""
+        acts = conversation.acts
+        act_ids = tuple(act.id for act in acts)
+        keys = []
+        key = hash(conversation.id)
+        for act_id in act_ids:
+            key = hash((key, act_id))
+            keys.append(key)
+
+        start, totals = 0, _NO_ACTS
+        for length in range(len(keys), 0, -1):
+            cached = self._totals.get(keys[length - 1])
+            # Hashes can collide, so the IDs are compared before reusing totals
+            if (
+                cached is not None
+                and cached[0] == conversation.id
+                and cached[1] == act_ids[:length]
+            ):
+                self._totals.move_to_end(keys[length - 1])
+                start, totals = length, cached[2]
+                break
+
+        if start < len(acts):
+            totals = _add_acts(totals, acts[start:])
+            self._totals[keys[-1]] = (conversation.id, act_ids, totals)
+            if len(self._totals) > self._maxsize:
+                self._totals.popitem(last=False)
+        return _metadata(conversation, totals)
+
+
+# Every model in this module. Validators and serializers are built on first
+# use (defer_build=True); ensure_built() builds them all up front.
+_MODELS = (
+    ActMetadata,
+    Act,
+    Entity,
+    RangeConstraint,
+    Constraint,
+    ParticipantPreferences,
+    Participant,
+    Ask,
+    Fact,
+    Confirm,
+    CommitError,
+    Commit,
+    Error,
+    ConversationContext,
+    ConversationMetadata,
+    Conversation,
+)
+
+# Model class for each act type
+_ACT_MODELS: Dict[ActType, Type[Act]] = {
+    ActType.ASK: Ask,
+    ActType.FACT: Fact,
+    ActType.CONFIRM: Confirm,
+    ActType.COMMIT: Commit,
+    ActType.ERROR: Error,
+}
+
+# The same models keyed by the plain type strings found in raw act data. Those
+# hit an interned str key directly, where a lookup in _ACT_MODELS has to
+# compare the str against an enum member.
+_ACT_MODELS_BY_TYPE: Dict[str, Type[Act]] = {
+    sys.intern(act_type.value): model for act_type, model in _ACT_MODELS.items()
+}
+
+# Built on first use by _act_adapter()
+_ACT_ADAPTER: Optional["TypeAdapter[ConversationAct]"] = None
+
+
+def _act_adapter() -> "TypeAdapter[ConversationAct]":
+    """Validator for acts of any type, selected by their ``type``"""
+    global _ACT_ADAPTER
+    if _ACT_ADAPTER is None:
+        _ACT_ADAPTER = TypeAdapter(_TaggedAct)
+    return _ACT_ADAPTER
+
 
 # ============================================================================
 # Utility Functions
 # ============================================================================
 
+def ensure_built() -> None:
+    """Build the validators and serializers of all ASTRA models
+
+    Models are built lazily the first time they are used. Call this at
+    startup to pay that cost once, e.g. before forking worker processes.
+    """
+    for model in _MODELS:
+        model.model_rebuild()
+
+
 def generate_act_id() -> str:
     """Generate ASTRA-compliant act ID"""
-    timestamp = hex(int(datetime.now().timestamp()))[2:]
-    random_part = str(uuid.uuid4()).replace('-', '')[:6]
-    return f"act_{timestamp}_{random_part}"
+    return "act_%x_%s" % (int(time.time()), os.urandom(3).hex())
 
 
 def generate_conversation_id() -> str:
     """Generate ASTRA-compliant conversation ID"""
-    timestamp = hex(int(datetime.now().timestamp()))[2:]
-    random_part = str(uuid.uuid4()).replace('-', '')[:6]
-    return f"conv_{timestamp}_{random_part}"
+    return "conv_%x_%s" % (int(time.time()), os.urandom(3).hex())
+
+
+# Matchers for the act and conversation ID patterns. fullmatch() anchors
+# both ends, so unlike "$" a trailing newline is not accepted.
+_ACT_ID = re.compile(r"act_[a-zA-Z0-9_-]+").fullmatch
+_CONVERSATION_ID = re.compile(r"conv_[a-zA-Z0-9_-]+").fullmatch
+
+
+def is_valid_act_id(value: str) -> bool:
+    """Check whether a string is a valid ASTRA act ID"""
+    return _ACT_ID(value) is not None
+
+
+def is_valid_conversation_id(value: str) -> bool:
+    """Check whether a string is a valid ASTRA conversation ID"""
+    return _CONVERSATION_ID(value) is not None
+
+
+# Minute since the epoch and its "YYYY-MM-DDTHH:MM:" prefix, reused until the
+# minute changes. Replaced as a whole so concurrent readers see a consistent
+# pair.
+_TIMESTAMP_PREFIX: Tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """Format the current UTC time as an ISO 8601 timestamp with a Z suffix"""
+    global _TIMESTAMP_PREFIX
+    seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+    minute, second = divmod(seconds, 60)
+    cached_minute, prefix = _TIMESTAMP_PREFIX
+    if minute != cached_minute:
+        prefix = "%04d-%02d-%02dT%02d:%02d:" % time.gmtime(seconds)[:5]
+        _TIMESTAMP_PREFIX = (minute, prefix)
+    return "%s%02d.%06dZ" % (prefix, second, nanoseconds // 1000)
 
 
 def create_base_act(
@@ -422,9 +785,74 @@ def create_base_act(
     """Create a base act structure with required fields"""
     base_act = {
         "id": generate_act_id(),
-        "timestamp": datetime.now().isoformat() + "Z",
+        "timestamp": _utc_timestamp(),
         "speaker": speaker,
         "type": act_type.value,
         **additional_fields
     }
     return base_act
+
+
+def make_act(act_type: Union[ActType, str], **fields: Any) -> Act:
+    """Validate fields as an act of the given type
+
+    The model is looked up in a table of act types instead of being picked
+    by the caller, e.g. ``make_act(row["type"], **row)`` for stored acts.
+    """
+    try:
+        model = _ACT_MODELS_BY_TYPE[act_type]
+    except KeyError:
+        raise ValueError(f"Unknown act type: {act_type!r}") from None
+    return model.model_validate({**fields, "type": act_type})
+
+
+def create_act(
+    speaker: str,
+    act_type: ActType,
+    *,
+    validate: bool = True,
+    **additional_fields: Any
+) -> Act:
+    """Create an act model of the given type with a generated ID and timestamp
+
+    With ``validate=False`` the act is built with ``model_construct()``, which
+    skips validation entirely. Only use it for trusted input whose fields
+    already have the model's types (e.g. enums and nested models, not raw
+    strings and dicts).
+    """
+    model = _ACT_MODELS[act_type]
+    fields = create_base_act(speaker, act_type, **additional_fields)
+    if validate:
+        return model.model_validate(fields)
+    fields["type"] = act_type
+    return model.model_construct(**fields)
+
+
+def decode_act(json_data: Union[str, bytes]) -> ConversationAct:
+    """Parse and validate an act of any type from JSON in a single pass
+
+    The act's ``type`` selects the model, and validation runs on the JSON
+    input directly, without building an intermediate dict.
+    """
+    return _act_adapter().validate_json(json_data)
+
+
+def iter_acts(stream: IO[bytes]) -> Iterator[ConversationAct]:
+    """Validate and yield the acts of a conversation JSON document one by one
+
+    With ``ijson`` installed the ``acts`` array is parsed incrementally, so
+    memory stays bounded by the largest act rather than the whole document,
+    and an invalid act is reported before the rest of the stream is read.
+    Without it the document is loaded in full and acts are validated lazily.
+    """
+    validate = _act_adapter().validate_python
+    if ijson is not None:
+        acts = ijson.items(stream, "acts.item", use_float=True)
+    else:
+        data = stream.read()
+        document = orjson.loads(data) if orjson is not None else json.loads(data)
+        if not isinstance(document, dict):
+            raise ValueError("Conversation JSON must be an object")
+        acts = document.get("acts", ())
+    for act in acts:
+        yield validate(act)
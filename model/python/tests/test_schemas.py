@@ -0,0 +1,667 @@
+"""
+Tests for ASTRA JSON schemas
+"""
+
+import json
+import os
+import subprocess
+import sys
+import pytest
+
+from astra_model.schemas import (
+    SCHEMAS,
+    SCHEMAS_JSON,
+    SchemaValidationError,
+    _LazySchemas,
+    _build_schema,
+    ensure_compiled,
+    get_bytes_pattern,
+    get_enum,
+    get_pattern,
+    get_schema,
+    get_validator,
+    validate,
+    validate_batch,
+    validate_shallow,
+)
+
+_BACKENDS = pytest.mark.parametrize(
+    "backend, module",
+    [
+        ("rs", "jsonschema_rs"),
+        ("gen", "astra_model"),
+        ("fast", "fastjsonschema"),
+        ("py", "jsonschema"),
+    ],
+)
+
+
+def _act_payloads():
+    """Dump one act of each type, as produced by the pydantic models"""
+    from astra_model import Ask, Commit, CommitAction, Confirm, Entity, Error, Fact
+
+    acts = [
+        Ask(id="act_001", timestamp="2025-01-15T14:30:00Z", speaker="agent_123",
+            field="email", prompt="What is your email?", confidence=0.9,
+            metadata={"channel": "chat", "turn": 1}),
+        Fact(id="act_002", timestamp="2025-01-15T14:31:00Z", speaker="customer_456",
+             entity=Entity(id="customer_456", type="customer"), field="email",
+             value="user@example.com"),
+        Confirm(id="act_003", timestamp="2025-01-15T14:32:00Z", speaker="agent_123",
+                entity="order_789", summary="Order for 2 pizzas"),
+        Commit(id="act_004", timestamp="2025-01-15T14:33:00Z", speaker="system_001",
+               entity="order_789", action=CommitAction.CREATE),
+        Error(id="act_005", timestamp="2025-01-15T14:34:00Z", speaker="system_001",
+              code="TIMEOUT", message="Order system timed out", recoverable=True),
+    ]
+    # Unset optional fields are dumped as null, which the schemas do not allow
+    return [act.model_dump(mode="json", exclude_none=True) for act in acts]
+
+
+def _act_base(act):
+    """Only the properties of an act allowed by the closed act schema"""
+    return {key: value for key, value in act.items() if key in SCHEMAS["act"]["properties"]}
+
+
+def _conversation_payload(acts):
+    return {
+        "id": "conv_001",
+        "participants": [{"id": "agent_123", "type": "ai"}],
+        "acts": acts,
+    }
+
+
+class TestSchemaRegistry:
+    """Tests for the lazily built schema mapping"""
+
+    def test_schemas_built_on_access(self):
+        """Test that schemas are only built when requested"""
+        schemas = _LazySchemas(_build_schema)
+        assert "fact" in schemas
+        assert schemas._cache == {}
+
+        fact_schema = schemas["fact"]
+        assert list(schemas._cache) == ["fact"]
+
+        # Cached for subsequent lookups
+        assert schemas["fact"] is fact_schema
+
+    def test_get_schema(self):
+        """Test looking up a single schema"""
+        assert get_schema("commit") is SCHEMAS["commit"]
+        assert get_schema("commit")["title"] == "Commit"
+
+    def test_unknown_schema(self):
+        """Test looking up a schema that does not exist"""
+        assert "unknown" not in SCHEMAS
+        with pytest.raises(KeyError):
+            SCHEMAS["unknown"]
+        with pytest.raises(KeyError):
+            get_schema("unknown")
+
+    def test_schemas_read_only(self):
+        """Test that schemas cannot be replaced"""
+        with pytest.raises(TypeError):
+            SCHEMAS["act"] = {}
+
+    def test_definitions_embedded(self):
+        """Test that every schema can resolve references to the others"""
+        from astra_model._schema_sources import FRAGMENTS
+
+        for schema in SCHEMAS.values():
+            assert set(schema["definitions"]) == set(SCHEMAS) | set(FRAGMENTS)
+            for definition in schema["definitions"].values():
+                assert "$id" not in definition
+                assert "definitions" not in definition
+
+    def test_schemas_json_serializable(self):
+        """Test that schemas can be written out as standalone JSON documents"""
+        for name, data in SCHEMAS_JSON.items():
+            assert json.loads(data)["$id"].endswith(f"/{name}.json")
+
+    def test_schemas_immutable(self):
+        """Test that schemas and their nested values cannot be modified"""
+        schema = SCHEMAS["act"]
+        with pytest.raises(TypeError):
+            schema["title"] = "Changed"
+        with pytest.raises(TypeError):
+            schema["properties"]["id"]["type"] = "integer"
+        assert isinstance(schema["required"], tuple)
+
+    def test_schema_strings_shared(self):
+        """Test that keys and string values are shared between schemas"""
+        act_id = SCHEMAS["act"]["properties"]["id"]
+        entity_id = SCHEMAS["entity"]["properties"]["id"]
+        assert act_id["type"] is entity_id["type"]
+
+        act_key = next(key for key in act_id if key == "description")
+        entity_key = next(key for key in entity_id if key == "description")
+        assert act_key is entity_key
+
+        assert SCHEMAS["act"]["required"][0] is SCHEMAS["entity"]["required"][0]
+
+        # Including descriptions repeated in every schema's definitions
+        assert (
+            SCHEMAS["act"]["definitions"]["entity"]["description"]
+            is SCHEMAS["entity"]["description"]
+        )
+
+    def test_identical_subschemas_shared(self):
+        """Test that identical subschemas are stored once"""
+        from astra_model.schemas import _freeze
+
+        assert SCHEMAS["act"]["definitions"] is SCHEMAS["entity"]["definitions"]
+        fact = SCHEMAS["fact"]["definitions"]["fact"]
+        participant = SCHEMAS["participant"]["properties"]
+        assert (
+            fact["properties"]["validation_errors"]["items"]
+            is participant["capabilities"]["items"]
+        )
+
+        # Equal but differently typed values are kept apart
+        assert _freeze({"const": 1}) is _freeze({"const": 1})
+        assert _freeze({"const": True})["const"] is True
+        assert _freeze([1.0]) is not _freeze([1])
+
+    def test_patterns_compiled(self):
+        """Test that pattern keywords are compiled once and shared"""
+        from astra_model import schemas
+
+        # Compiled when the schema is loaded
+        id_pattern = SCHEMAS["act"]["properties"]["id"]["pattern"]
+        compiled = schemas._PATTERN_CACHE[id_pattern]
+
+        assert get_pattern(id_pattern) is compiled
+        assert compiled.match("act_001")
+        assert not compiled.match("invalid_id")
+
+    def test_bytes_patterns(self):
+        """Test matching schema patterns against undecoded bytes"""
+        id_pattern = SCHEMAS["act"]["properties"]["id"]["pattern"]
+        compiled = get_bytes_pattern(id_pattern)
+
+        assert get_bytes_pattern(id_pattern) is compiled
+        assert compiled.search(b"act_001")
+        assert not compiled.search(b"invalid_id")
+        with pytest.raises(ValueError):
+            get_bytes_pattern("^caf\u00e9$")
+
+    def test_enums_as_sets(self):
+        """Test that enum keywords are available as shared frozensets"""
+        from astra_model import schemas
+
+        act_types = SCHEMAS["act"]["properties"]["type"]["enum"]
+        allowed = schemas._ENUM_CACHE[act_types]
+
+        assert get_enum(act_types) is allowed
+        assert get_enum(list(act_types)) is allowed
+        assert allowed == frozenset({"ask", "fact", "confirm", "commit", "error"})
+
+
+class TestSchemaFiles:
+    """Tests for the generated schema documents"""
+
+    def test_schema_files_up_to_date(self):
+        """Test that the shipped documents match the source definitions"""
+        from astra_model._schema_sources import SOURCES, build_schema
+
+        assert list(SOURCES) == list(SCHEMAS)
+        for name in SCHEMAS:
+            assert _build_schema(name) == build_schema(name), (
+                f"{name}.json is out of date, run scripts/generate_schemas.py"
+            )
+
+    def test_validators_up_to_date(self):
+        """Test that the shipped validators match the source definitions"""
+        from pathlib import Path
+
+        from astra_model import _validators
+        from astra_model._codegen import generate_module
+        from astra_model._schema_sources import SOURCES, build_schema
+
+        expected = generate_module({name: build_schema(name) for name in SOURCES})
+        # Read the source next to the module, which may be compiled with mypyc
+        source = Path(_validators.__file__).with_name("_validators.py")
+        assert source.read_text(encoding="utf-8") == expected, (
+            "_validators.py is out of date, run scripts/generate_schemas.py"
+        )
+        assert list(_validators.VALIDATORS) == list(SCHEMAS)
+
+    def test_generated_validators_standalone(self):
+        """Test that the generated validators run without the code generator"""
+        code = (
+            "import sys; from astra_model import schemas; "
+            "schemas.validate('entity', {'id': 'customer_1', 'type': 'customer'}); "
+            "assert 'astra_model._codegen' not in sys.modules"
+        )
+        env = {**os.environ, "ASTRA_VALIDATOR": "gen"}
+        subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+    def test_load_without_orjson(self, monkeypatch):
+        """Test that the stdlib fallback loads the same documents"""
+        from astra_model import schemas
+
+        expected = _build_schema("conversation")
+        monkeypatch.setattr(schemas, "orjson", None)
+        assert schemas._build_schema("conversation") == expected
+
+    def test_load_from_zip(self, tmp_path):
+        """Test loading the documents from a zipped package"""
+        import shutil
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        import astra_model
+
+        package_dir = Path(astra_model.__file__).parent
+        archive = shutil.make_archive(
+            str(tmp_path / "astra"), "zip", package_dir.parent, package_dir.name
+        )
+        code = "from astra_model.schemas import SCHEMAS; print(SCHEMAS['act']['title'])"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env={"PYTHONPATH": archive},
+            check=True,
+        )
+        assert result.stdout.strip() == "Act"
+
+    def test_regenerate_from_sources(self, monkeypatch):
+        """Test building schemas from the source definitions"""
+        from astra_model import schemas
+
+        monkeypatch.setattr(schemas, "_REGENERATE", True)
+        assert schemas._build_schema("fact")["title"] == "Fact"
+
+
+class TestSchemaJSON:
+    """Tests for the pre-serialized schema documents"""
+
+    def test_schema_json_matches_schema(self):
+        """Test that the serialized form matches the schema dictionary"""
+        assert list(SCHEMAS_JSON) == list(SCHEMAS)
+        for name, data in SCHEMAS_JSON.items():
+            assert isinstance(data, bytes)
+            assert json.loads(data) == _build_schema(name)
+
+    def test_schema_json_without_orjson(self, monkeypatch):
+        """Test that the stdlib fallback produces the same document"""
+        from astra_model import schemas
+
+        expected = schemas._build_schema_json("conversation")
+        monkeypatch.setattr(schemas, "orjson", None)
+        assert schemas._build_schema_json("conversation") == expected
+
+    def test_schema_json_cached(self):
+        """Test that each schema is only serialized once"""
+        assert SCHEMAS_JSON["act"] is SCHEMAS_JSON["act"]
+
+
+class TestValidators:
+    """Tests for cached JSON Schema validators"""
+
+    def test_validator_cached(self):
+        """Test that validators are compiled once per schema"""
+        pytest.importorskip("jsonschema")
+        assert get_validator("entity") is get_validator("entity")
+
+    def test_validator_validates(self):
+        """Test validating instances against a schema"""
+        pytest.importorskip("jsonschema")
+        validator = get_validator("entity")
+        assert validator.is_valid({"id": "customer_123", "type": "customer"})
+        assert not validator.is_valid({"id": "customer_123"})
+
+        act_validator = get_validator("act")
+        assert act_validator.is_valid({
+            "id": "act_001",
+            "timestamp": "2025-01-15T14:30:00Z",
+            "speaker": "agent_123",
+            "type": "ask",
+        })
+        assert not act_validator.is_valid({
+            "id": "invalid_id",
+            "timestamp": "2025-01-15T14:30:00Z",
+            "speaker": "agent_123",
+            "type": "ask",
+        })
+
+    def test_unknown_validator(self):
+        """Test requesting a validator for an unknown schema"""
+        with pytest.raises(KeyError):
+            get_validator("unknown")
+
+    def test_validate(self):
+        """Test validating instances with the compiled validators"""
+        validate("entity", {"id": "customer_123", "type": "customer"})
+        with pytest.raises(SchemaValidationError):
+            validate("entity", {"id": "customer_123"})
+        with pytest.raises(SchemaValidationError):
+            validate("act", {
+                "id": "invalid_id",
+                "timestamp": "2025-01-15T14:30:00Z",
+                "speaker": "agent_123",
+                "type": "ask",
+            })
+
+    def test_ensure_compiled(self):
+        """Test compiling validators ahead of first use"""
+        from astra_model.schemas import _COMPILED
+
+        ensure_compiled(["entity"])
+        assert "entity" in _COMPILED._cache
+        ensure_compiled()
+        assert set(_COMPILED._cache) == set(SCHEMAS)
+        validate("conversation", _conversation_payload(_act_payloads()))
+
+    def test_validate_batch(self):
+        """Test validating many instances against one schema"""
+        entities = [{"id": f"customer_{i}", "type": "customer"} for i in range(3)]
+        validate_batch("entity", entities)
+        validate_batch("entity", iter(entities))
+
+        entities.append({"id": "customer_3"})
+        with pytest.raises(SchemaValidationError, match="^instance 3: "):
+            validate_batch("entity", entities)
+
+        acts = _act_payloads()
+        validate_batch("act", [_act_base(act) for act in acts])
+        validate_batch("conversation", [_conversation_payload(acts)] * 2)
+        with pytest.raises(SchemaValidationError, match="^instance 1: "):
+            validate_batch("ask", [acts[0], {**acts[0], "id": "invalid_id"}])
+
+    def test_validate_shallow(self):
+        """Test checking only the required properties and act type"""
+        ask = {
+            "id": "act_001",
+            "timestamp": "2025-01-15T14:30:00Z",
+            "speaker": "agent_123",
+            "type": "ask",
+            "field": "email",
+            "prompt": "What is your email?",
+        }
+        validate_shallow("ask", ask)
+        validate_shallow("act", ask)
+        # Only the shape is checked, not the values
+        validate_shallow("ask", {**ask, "id": "invalid_id"})
+
+        with pytest.raises(SchemaValidationError, match="prompt"):
+            validate_shallow("ask", {k: v for k, v in ask.items() if k != "prompt"})
+        with pytest.raises(SchemaValidationError, match="type"):
+            validate_shallow("fact", {**ask, "entity": "e", "value": 1})
+        with pytest.raises(SchemaValidationError):
+            validate_shallow("ask", [ask])
+
+        validate_shallow("entity", {"id": "customer_123", "type": "anything"})
+
+    @_BACKENDS
+    def test_validation_backends(self, monkeypatch, backend, module):
+        """Test that every backend accepts and rejects the same instances"""
+        pytest.importorskip(module)
+        from astra_model import schemas
+
+        monkeypatch.setattr(schemas, "_VALIDATOR_BACKEND", backend)
+        check = schemas._build_compiled("entity")
+        check({"id": "customer_123", "type": "customer"})
+        with pytest.raises(SchemaValidationError):
+            check({"id": "customer_123"})
+
+    @_BACKENDS
+    def test_backends_accept_acts(self, monkeypatch, backend, module):
+        """Test that every backend accepts acts and conversations from the models"""
+        pytest.importorskip(module)
+        from astra_model import schemas
+
+        monkeypatch.setattr(schemas, "_VALIDATOR_BACKEND", backend)
+        acts = _act_payloads()
+        for act in acts:
+            schemas._build_compiled(act["type"])(act)
+            schemas._build_compiled("act")(_act_base(act))
+        schemas._build_compiled("conversation")(_conversation_payload(acts))
+
+        with pytest.raises(SchemaValidationError):
+            schemas._build_compiled("ask")({**acts[0], "id": "invalid_id"})
+        # Acts are closed: unknown properties are rejected, as by the models
+        for act in acts:
+            with pytest.raises(SchemaValidationError):
+                schemas._build_compiled(act["type"])({**act, "bogus": 1})
+        with pytest.raises(SchemaValidationError):
+            schemas._build_compiled("act")(acts[0])
+        with pytest.raises(SchemaValidationError):
+            schemas._build_compiled("conversation")(
+                _conversation_payload([{**acts[2], "bogus": 1}])
+            )
+        with pytest.raises(SchemaValidationError):
+            schemas._build_compiled("conversation")(
+                _conversation_payload([{**acts[1], "type": "ask"}])
+            )
+
+    def test_validator_bytecode_cache(self, monkeypatch, tmp_path):
+        """Test that fastjsonschema validators are reused from the disk cache"""
+        fastjsonschema = pytest.importorskip("fastjsonschema")
+        from astra_model import schemas
+
+        monkeypatch.setattr(schemas, "_VALIDATOR_BACKEND", "fast")
+        monkeypatch.setattr(schemas, "_VALIDATOR_CACHE_DIR", str(tmp_path))
+        schemas._build_compiled("entity")
+        assert len(list(tmp_path.glob("entity-*.bin"))) == 1
+
+        def fail(*args, **kwargs):
+            raise AssertionError("validator was compiled again")
+
+        monkeypatch.setattr(fastjsonschema, "compile_to_code", fail)
+        check = schemas._build_compiled("entity")
+        check({"id": "customer_123", "type": "customer"})
+        with pytest.raises(SchemaValidationError):
+            check({"id": "customer_123"})
+
+    def test_validation_backend_fallback(self, monkeypatch):
+        """Test that generated validators are used without jsonschema_rs"""
+        from astra_model import schemas
+
+        def compile_gen(name):
+            return "gen"
+
+        monkeypatch.setattr(schemas, "jsonschema_rs", None)
+        monkeypatch.setitem(schemas._BACKENDS, "gen", compile_gen)
+        assert schemas._build_compiled("entity") == "gen"
+
+    def test_unknown_validation_backend(self, monkeypatch):
+        """Test selecting a backend that does not exist"""
+        from astra_model import schemas
+
+        monkeypatch.setattr(schemas, "_VALIDATOR_BACKEND", "unknown")
+        with pytest.raises(ValueError, match="unknown"):
+            schemas._build_compiled("entity")
+
+
+class TestGeneratedValidators:
+    """Tests for validators generated from the schemas"""
+
+    INSTANCES = {
+        "entity": [
+            {"id": "customer_123", "type": "customer"},
+            {"id": "customer_123", "type": "customer", "metadata": {"tier": 1}},
+            {"id": "customer_123"},
+            {"id": 123, "type": "customer"},
+            {"id": "customer_123", "type": "customer", "unknown": True},
+            ["customer_123"],
+        ],
+        "participant": [
+            {"id": "p1", "type": "ai", "preferences": {"language": "en-US"}},
+            {"id": "p1", "type": "ai", "preferences": {"language": "english"}},
+            {"id": "p1", "type": "robot"},
+            {"id": "p1", "type": "ai", "capabilities": ["search", 1]},
+        ],
+        "act": [
+            {"id": "act_001", "timestamp": "t", "speaker": "a", "type": "ask"},
+            {"id": "act_001", "timestamp": "t", "speaker": "a", "type": "ask", "confidence": 1},
+            {"id": "act_001", "timestamp": "t", "speaker": "a", "type": "ask", "confidence": 1.5},
+            {"id": "act_001", "timestamp": "t", "speaker": "a", "type": "ask", "confidence": True},
+            {"id": "invalid_id", "timestamp": "t", "speaker": "a", "type": "ask"},
+            {"id": "act_001", "timestamp": "t", "speaker": "a", "type": "unknown"},
+        ],
+        "conversation": [
+            {"id": "conv_001", "participants": [{"id": "p1", "type": "ai"}], "acts": []},
+            {"id": "conv_001", "participants": [], "acts": []},
+            {"id": "conv_001", "participants": [{"id": "p1", "type": "ai"}], "acts": [{}]},
+            {
+                "id": "conv_001",
+                "participants": [{"id": "p1", "type": "ai"}],
+                "acts": [],
+                "metadata": {"act_count": 2.0, "avg_confidence": 0.5},
+            },
+            {
+                "id": "conv_001",
+                "participants": [{"id": "p1", "type": "ai"}],
+                "acts": [],
+                "metadata": {"act_count": -1},
+            },
+        ],
+    }
+
+    @pytest.mark.parametrize("name", list(INSTANCES))
+    def test_matches_jsonschema(self, name):
+        """Test that generated validators agree with jsonschema"""
+        pytest.importorskip("jsonschema")
+        from astra_model._codegen import compile_validator
+
+        check = compile_validator(SCHEMAS[name], SchemaValidationError)
+        for instance in self.INSTANCES[name]:
+            try:
+                check(instance)
+            except SchemaValidationError:
+                valid = False
+            else:
+                valid = True
+            assert valid == get_validator(name).is_valid(instance), instance
+
+    def test_real_acts(self):
+        """Test generated validators on acts and conversations from the models"""
+        pytest.importorskip("jsonschema")
+        from astra_model._codegen import compile_validator
+        from astra_model._validators import VALIDATORS
+
+        acts = _act_payloads()
+        instances = {name: [] for name in ("act", "ask", "fact", "confirm", "commit",
+                                           "error", "conversation")}
+        for act in acts:
+            no_speaker = {k: v for k, v in act.items() if k != "speaker"}
+            for variant in (act, {**act, "id": "invalid_id"}, no_speaker):
+                instances["act"].append(variant)
+                instances[act["type"]].append(variant)
+                instances["conversation"].append(_conversation_payload([variant]))
+        instances["conversation"].append(_conversation_payload(acts))
+
+        for name, cases in instances.items():
+            compiled = compile_validator(SCHEMAS[name], SchemaValidationError)
+            for check in (VALIDATORS[name], compiled):
+                for instance in cases:
+                    try:
+                        check(instance)
+                    except SchemaValidationError:
+                        valid = False
+                    else:
+                        valid = True
+                    assert valid == get_validator(name).is_valid(instance), (name, instance)
+
+    def test_act_dispatch_errors(self):
+        """Test that conversation acts are checked against the schema named by their type"""
+        from astra_model._validators import VALIDATORS
+
+        acts = _act_payloads()
+        fact = {k: v for k, v in acts[1].items() if k != "value"}
+        with pytest.raises(SchemaValidationError, match=r"acts\[1\] is missing required property 'value'"):
+            VALIDATORS["conversation"](_conversation_payload([acts[0], fact]))
+        with pytest.raises(SchemaValidationError, match=r"acts\[0\] must match exactly one"):
+            VALIDATORS["conversation"](_conversation_payload([{**acts[0], "type": "unknown"}]))
+
+    def test_all_schemas_supported(self):
+        """Test that a validator can be generated for every schema"""
+        from astra_model._codegen import generate
+
+        for name in SCHEMAS:
+            source, _ = generate(SCHEMAS[name])
+            assert "def validate(data: Any) -> None:" in source
+
+    def test_conditional(self):
+        """Test if/then/else, including conditions beyond a type check"""
+        pytest.importorskip("jsonschema")
+        from jsonschema import Draft202012Validator
+        from astra_model._codegen import compile_validator
+
+        schema = {
+            "if": {"type": "string", "pattern": "^act_"},
+            "then": {"pattern": "_[0-9]+$"},
+            "else": {"type": "integer"},
+        }
+        check = compile_validator(schema, SchemaValidationError)
+        for instance in ("act_001", "act_x", "conv_001", 1, 1.5, None):
+            try:
+                check(instance)
+            except SchemaValidationError:
+                valid = False
+            else:
+                valid = True
+            assert valid == Draft202012Validator(schema).is_valid(instance), instance
+
+    def test_module_requires_shared_definitions(self):
+        """Test that schemas with different definitions cannot share a module"""
+        from astra_model._codegen import generate_module
+
+        with pytest.raises(ValueError):
+            generate_module({
+                "a": {"definitions": {"x": {"type": "string"}}},
+                "b": {"definitions": {"x": {"type": "integer"}}},
+            })
+
+    def test_tagged_one_of(self):
+        """Test oneOf over objects told apart by a const property"""
+        pytest.importorskip("jsonschema")
+        from jsonschema import Draft202012Validator
+        from astra_model._codegen import compile_validator, generate
+
+        schema = {
+            "oneOf": [
+                {"$ref": "#/definitions/a"},
+                {"type": "object", "required": ["kind", "n"],
+                 "properties": {"kind": {"const": "b"}, "n": {"type": "integer"}}},
+            ],
+            "definitions": {
+                "a": {"type": "object", "required": ["kind"],
+                      "properties": {"kind": {"const": "a"}}},
+            },
+        }
+        source, _ = generate(schema)
+        assert "except _Invalid" not in source
+        check = compile_validator(schema, SchemaValidationError)
+        for instance in ({"kind": "a"}, {"kind": "b", "n": 1}, {"kind": "b"},
+                         {"kind": "c"}, {}, {"kind": 1}, [], "a"):
+            try:
+                check(instance)
+            except SchemaValidationError:
+                valid = False
+            else:
+                valid = True
+            assert valid == Draft202012Validator(schema).is_valid(instance), instance
+
+    def test_error_location(self):
+        """Test that errors name the invalid part of the instance"""
+        from astra_model._codegen import compile_validator
+
+        check = compile_validator(SCHEMAS["conversation"], SchemaValidationError)
+        with pytest.raises(SchemaValidationError, match=r"data\.participants\[1\]\.type"):
+            check({
+                "id": "conv_001",
+                "participants": [{"id": "p1", "type": "ai"}, {"id": "p2", "type": "robot"}],
+                "acts": [],
+            })
+
+    def test_unsupported_keyword(self):
+        """Test that schemas using unsupported keywords are rejected"""
+        from astra_model._codegen import generate
+
+        with pytest.raises(NotImplementedError, match="anyOf"):
+            generate({"anyOf": [{"type": "string"}, {"type": "null"}]})
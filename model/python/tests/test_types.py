@@ -2,11 +2,20 @@
 Tests for ASTRA Python types and utilities
 """
 
+import ast
+import io
 import json
+import pickle
+import re
+import subprocess
+import sys
 import pytest
 from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
 from pydantic import ValidationError
 
+import astra_model
 from astra_model import (
     # Types
     Act,
@@ -37,7 +46,14 @@ from astra_model import (
     # Utilities
     generate_act_id,
     generate_conversation_id,
+    is_valid_act_id,
+    is_valid_conversation_id,
+    decode_act,
+    iter_acts,
+    make_act,
     create_base_act,
+    create_act,
+    ensure_built,
     
     # Constants
     __version__,
@@ -47,20 +63,58 @@ from astra_model import (
     SCHEMAS
 )
 
+_ACT_ID_RE = re.compile(r"^act_[a-zA-Z0-9_-]+$")
+_CONV_ID_RE = re.compile(r"^conv_[a-zA-Z0-9_-]+$")
+
+
+# Canonical instances shared by the tests below. They are built once per
+# module; tests that need a variant should model_copy() them, not mutate them.
+
+@pytest.fixture(scope="module")
+def canonical_ask():
+    return Ask(
+        id="act_001",
+        timestamp="2025-01-15T14:30:00Z",
+        speaker="agent_123",
+        type=ActType.ASK,
+        field="email",
+        prompt="What is your email address?"
+    )
+
+
+@pytest.fixture(scope="module")
+def canonical_fact():
+    return Fact(
+        id="act_002",
+        timestamp="2025-01-15T14:31:00Z",
+        speaker="customer_456",
+        type=ActType.FACT,
+        entity="customer_456",
+        field="email",
+        value="user@example.com"
+    )
+
+
+@pytest.fixture(scope="module")
+def canonical_conversation(canonical_ask, canonical_fact):
+    return Conversation(
+        id="conv_001",
+        # Trusted setup data that no test checks, so not validated
+        participants=[
+            Participant.model_construct(id="agent_123", type=ParticipantType.AI),
+            Participant.model_construct(id="customer_456", type=ParticipantType.HUMAN),
+        ],
+        acts=[canonical_ask, canonical_fact],
+        status=ConversationStatus.ACTIVE
+    )
+
 
 class TestActTypes:
     """Tests for core Act types"""
     
-    def test_ask_creation(self):
+    def test_ask_creation(self, canonical_ask):
         """Test creating Ask acts"""
-        ask = Ask(
-            id="act_001",
-            timestamp="2025-01-15T14:30:00Z",
-            speaker="agent_123",
-            type=ActType.ASK,
-            field="email",
-            prompt="What is your email address?"
-        )
+        ask = canonical_ask
         
         assert ask.id == "act_001"
         assert ask.type == ActType.ASK
@@ -92,18 +146,10 @@ class TestActTypes:
                 prompt="What is your email?"
             )
     
-    def test_fact_creation(self):
+    def test_fact_creation(self, canonical_fact):
         """Test creating Fact acts"""
         # With string entity
-        fact1 = Fact(
-            id="act_002",
-            timestamp="2025-01-15T14:30:00Z",
-            speaker="customer_456",
-            type=ActType.FACT,
-            entity="customer_456",
-            field="email",
-            value="user@example.com"
-        )
+        fact1 = canonical_fact
         
         assert fact1.entity == "customer_456"
         assert fact1.value == "user@example.com"
@@ -126,55 +172,35 @@ class TestActTypes:
         assert fact2.entity.id == "customer_456"
         assert fact2.operation == FieldOperation.APPEND
     
-    def test_confirm_creation(self):
-        """Test creating Confirm acts"""
-        confirm = Confirm(
+    @pytest.mark.parametrize("model, fields, expected", [
+        (
+            Confirm,
+            {"entity": "order_789", "summary": "Order for 2 pizzas to be delivered at 6 PM"},
+            # awaiting by default, not yet confirmed
+            {"type": ActType.CONFIRM, "awaiting": True, "confirmed": None},
+        ),
+        (
+            Commit,
+            {"entity": "order_789", "action": CommitAction.CREATE, "system": "order_management"},
+            {"type": ActType.COMMIT, "status": CommitStatus.PENDING, "retry_count": 0},
+        ),
+        (
+            Error,
+            {"code": "VALIDATION_ERROR", "message": "Invalid email format", "recoverable": True},
+            {"type": ActType.ERROR, "severity": ErrorSeverity.ERROR},
+        ),
+    ])
+    def test_act_creation(self, model, fields, expected):
+        """Test creating Confirm, Commit and Error acts"""
+        act = model(
             id="act_004",
             timestamp="2025-01-15T14:30:00Z",
             speaker="agent_123",
-            type=ActType.CONFIRM,
-            entity="order_789",
-            summary="Order for 2 pizzas to be delivered at 6 PM"
-        )
-        
-        assert confirm.entity == "order_789"
-        assert confirm.summary == "Order for 2 pizzas to be delivered at 6 PM"
-        assert confirm.awaiting is True  # default
-        assert confirm.confirmed is None  # not yet confirmed
-    
-    def test_commit_creation(self):
-        """Test creating Commit acts"""
-        commit = Commit(
-            id="act_005",
-            timestamp="2025-01-15T14:30:00Z",
-            speaker="system_001",
-            type=ActType.COMMIT,
-            entity="order_789",
-            action=CommitAction.CREATE,
-            system="order_management"
+            **fields
         )
         
-        assert commit.action == CommitAction.CREATE
-        assert commit.system == "order_management"
-        assert commit.status == CommitStatus.PENDING  # default
-        assert commit.retry_count == 0  # default
-    
-    def test_error_creation(self):
-        """Test creating Error acts"""
-        error = Error(
-            id="act_006",
-            timestamp="2025-01-15T14:30:00Z",
-            speaker="system_001",
-            type=ActType.ERROR,
-            code="VALIDATION_ERROR",
-            message="Invalid email format",
-            recoverable=True
-        )
-        
-        assert error.code == "VALIDATION_ERROR"
-        assert error.message == "Invalid email format"
-        assert error.recoverable is True
-        assert error.severity == ErrorSeverity.ERROR  # default
+        for name, value in {**fields, **expected}.items():
+            assert getattr(act, name) == value, name
 
 
 class TestEntityTypes:
@@ -233,30 +259,13 @@ class TestParticipantTypes:
 class TestConversationTypes:
     """Tests for Conversation types"""
     
-    def test_conversation_creation(self):
+    def test_conversation_creation(self, canonical_conversation):
         """Test creating Conversation objects"""
-        agent = Participant(id="agent_001", type=ParticipantType.AI)
-        customer = Participant(id="customer_123", type=ParticipantType.HUMAN)
-        
-        ask = Ask(
-            id="act_001",
-            timestamp="2025-01-15T14:30:00Z",
-            speaker="agent_001",
-            type=ActType.ASK,
-            field="email",
-            prompt="What is your email?"
-        )
-        
-        conversation = Conversation(
-            id="conv_001",
-            participants=[agent, customer],
-            acts=[ask],
-            status=ConversationStatus.ACTIVE
-        )
+        conversation = canonical_conversation
         
         assert conversation.id == "conv_001"
         assert len(conversation.participants) == 2
-        assert len(conversation.acts) == 1
+        assert len(conversation.acts) == 2
         assert conversation.status == ConversationStatus.ACTIVE
     
     def test_conversation_validation(self):
@@ -277,6 +286,147 @@ class TestConversationTypes:
                 acts=[]
             )
 
+    def test_conversation_act_dispatch(self):
+        """Test that each act is validated by the model named by its type"""
+        base = {"timestamp": "2025-01-15T14:30:00Z", "speaker": "agent_001"}
+        conversation = Conversation.model_validate({
+            "id": "conv_001",
+            "participants": [{"id": "agent_001", "type": "ai"}],
+            "acts": [
+                {**base, "id": "act_001", "type": "confirm", "entity": "order_1", "summary": "Order"},
+                {**base, "id": "act_002", "type": "error", "code": "E1", "message": "Failed",
+                 "recoverable": False},
+            ],
+        })
+        assert [type(act) for act in conversation.acts] == [Confirm, Error]
+
+        with pytest.raises(ValidationError, match="does not match any of the expected tags"):
+            Conversation.model_validate({
+                "id": "conv_001",
+                "participants": [{"id": "agent_001", "type": "ai"}],
+                "acts": [{**base, "id": "act_001", "type": "unknown"}],
+            })
+
+    def test_compute_metadata(self):
+        """Test aggregating act counts and confidence"""
+        base = {"timestamp": "2025-01-15T14:30:00Z", "speaker": "agent_001"}
+        conversation = Conversation.model_validate({
+            "id": "conv_001",
+            "participants": [{"id": "agent_001", "type": "ai"}],
+            "acts": [
+                {**base, "id": "act_001", "type": "ask", "field": "email", "prompt": "Email?",
+                 "confidence": 0.5},
+                {**base, "id": "act_002", "type": "commit", "entity": "order_1", "action": "create",
+                 "status": "success", "confidence": 1.0},
+                {**base, "id": "act_003", "type": "commit", "entity": "order_1", "action": "update",
+                 "status": "failed"},
+                {**base, "id": "act_004", "type": "error", "code": "E1", "message": "Failed",
+                 "recoverable": True},
+            ],
+            "metadata": {"total_duration_ms": 1200},
+        })
+
+        metadata = conversation.compute_metadata()
+        assert metadata.act_count == 4
+        assert metadata.error_count == 1
+        assert metadata.commit_count == 1
+        assert metadata.avg_confidence == 0.75
+        assert metadata.total_duration_ms == 1200
+
+        # Unvalidated acts may hold plain strings instead of the enum members
+        conversation.acts = [
+            Error.model_construct(**base, id="act_005", type="error", code="E1", message="Failed"),
+            create_act("agent_001", ActType.COMMIT, validate=False, entity="order_1",
+                       action="create", status="success"),
+        ]
+        metadata = conversation.compute_metadata()
+        assert (metadata.error_count, metadata.commit_count) == (1, 1)
+
+        conversation.acts = []
+        assert conversation.compute_metadata().avg_confidence is None
+
+    def test_act_columns(self):
+        """Test the column-wise view of a conversation's acts"""
+        import math
+        from astra_model import ActColumns
+
+        base = {"timestamp": "2025-01-15T14:30:00Z", "speaker": "agent_001"}
+        conversation = Conversation(
+            id="conv_001",
+            participants=[Participant(id="agent_001", type=ParticipantType.AI)],
+            acts=[
+                Ask(**base, id="act_001", field="email", prompt="Email?", confidence=0.5),
+                Error(**base, id="act_002", code="E1", message="Failed", recoverable=True),
+                Error(**base, id="act_003", code="E2", message="Failed", recoverable=True),
+            ],
+        )
+
+        columns = conversation.act_columns()
+        assert len(columns) == 3
+        assert columns.count(ActType.ERROR) == 2
+        assert columns.count(ActType.COMMIT) == 0
+        assert columns.types[0] == ActColumns.code(ActType.ASK)
+        assert columns.confidences[0] == 0.5
+        assert math.isnan(columns.confidences[1])
+        assert columns.speakers == ["agent_001"] * 3
+
+    def test_conversation_cache(self, monkeypatch):
+        """Test that cached totals only fold in appended acts"""
+        from astra_model import ConversationCache, types
+
+        folded = []
+        add_acts = types._add_acts
+
+        def record_add_acts(totals, acts):
+            folded.append(len(acts))
+            return add_acts(totals, acts)
+
+        monkeypatch.setattr(types, "_add_acts", record_add_acts)
+
+        def error(index):
+            return Error(id=f"act_{index:03d}", timestamp="2025-01-15T14:30:00Z", speaker="system",
+                         code="E1", message="Failed", recoverable=True, confidence=index / 10)
+
+        conversation = Conversation(
+            id="conv_001",
+            participants=[Participant(id="system", type=ParticipantType.SYSTEM)],
+            acts=[error(1), error(2)],
+        )
+        cache = ConversationCache()
+        first = cache.compute_metadata(conversation)
+        conversation.acts.append(error(3))
+        second = cache.compute_metadata(conversation)
+        assert folded == [2, 1]
+        assert second.error_count == 3
+        assert second == conversation.compute_metadata()
+        conversation.acts.pop()
+        assert first == conversation.compute_metadata()
+
+        # A different history with a shared prefix reuses nothing past it
+        conversation.acts[1:] = [error(4)]
+        assert cache.compute_metadata(conversation) == conversation.compute_metadata()
+
+        # Act IDs are only unique within a conversation
+        other = Conversation(
+            id="conv_002",
+            participants=[Participant(id="agent", type=ParticipantType.AI)],
+            acts=[
+                Ask(id=f"act_{index:03d}", timestamp="2025-01-15T14:30:00Z", speaker="agent",
+                    field="email", prompt="What is your email?", confidence=0.9)
+                for index in (1, 2)
+            ],
+        )
+        metadata = cache.compute_metadata(other)
+        assert metadata == other.compute_metadata()
+        assert metadata.error_count == 0
+        assert metadata.avg_confidence == 0.9
+
+        # Colliding hashes are not mistaken for a cached prefix
+        cache = ConversationCache()
+        monkeypatch.setattr(types, "hash", lambda value: 0, raising=False)
+        cache.compute_metadata(conversation)
+        assert cache.compute_metadata(other) == other.compute_metadata()
+
 
 class TestUtilityFunctions:
     """Tests for utility functions"""
@@ -294,10 +444,8 @@ class TestUtilityFunctions:
         assert id1 != id2
         
         # Should match pattern
-        import re
-        pattern = r"^act_[a-zA-Z0-9_-]+$"
-        assert re.match(pattern, id1)
-        assert re.match(pattern, id2)
+        assert _ACT_ID_RE.match(id1)
+        assert _ACT_ID_RE.match(id2)
     
     def test_generate_conversation_id(self):
         """Test conversation ID generation"""
@@ -312,11 +460,21 @@ class TestUtilityFunctions:
         assert id1 != id2
         
         # Should match pattern
-        import re
-        pattern = r"^conv_[a-zA-Z0-9_-]+$"
-        assert re.match(pattern, id1)
-        assert re.match(pattern, id2)
+        assert _CONV_ID_RE.match(id1)
+        assert _CONV_ID_RE.match(id2)
     
+    def test_id_validation(self):
+        """Test checking act and conversation IDs"""
+        assert is_valid_act_id(generate_act_id())
+        assert is_valid_act_id("act_001")
+        assert not is_valid_act_id("act_")
+        assert not is_valid_act_id("act_001\n")
+        assert not is_valid_act_id("conv_001")
+
+        assert is_valid_conversation_id(generate_conversation_id())
+        assert not is_valid_conversation_id("conv_a b")
+        assert not is_valid_conversation_id("act_001")
+
     def test_create_base_act(self):
         """Test base act creation"""
         base_act = create_base_act(
@@ -333,66 +491,140 @@ class TestUtilityFunctions:
         assert "id" in base_act
         assert "timestamp" in base_act
 
+    def test_create_base_act_timestamp_is_utc(self):
+        """Test that generated timestamps are the current UTC time"""
+        from datetime import timezone
+
+        timestamp = create_base_act(speaker="test_speaker", act_type=ActType.ASK)["timestamp"]
+        assert timestamp.endswith("Z")
+        parsed = datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc)
+        assert abs((datetime.now(timezone.utc) - parsed).total_seconds()) < 60
+
+    def test_create_act(self):
+        """Test creating validated act models"""
+        ask = create_act(
+            speaker="agent_123",
+            act_type=ActType.ASK,
+            field="email",
+            prompt="What is your email?"
+        )
+
+        assert isinstance(ask, Ask)
+        assert ask.id.startswith("act_")
+        assert ask.type == ActType.ASK
+        assert ask.required is True  # default
+
+        with pytest.raises(ValidationError):
+            create_act(speaker="agent_123", act_type=ActType.ASK, field="email")
+
+    def test_create_act_without_validation(self):
+        """Test creating trusted act models without validation"""
+        commit = create_act(
+            speaker="system_001",
+            act_type=ActType.COMMIT,
+            validate=False,
+            entity="order_789",
+            action=CommitAction.CREATE
+        )
+
+        assert isinstance(commit, Commit)
+        assert commit.type is ActType.COMMIT
+        assert commit.action == CommitAction.CREATE
+        assert commit.status == CommitStatus.PENDING  # default
+        assert Commit.model_validate(commit.model_dump()) == commit
+
+    def test_make_act(self):
+        """Test building act models from their type and fields"""
+        fields = {"id": "act_001", "timestamp": "2025-01-15T14:30:00Z", "speaker": "agent_001",
+                  "entity": "order_1", "summary": "Order"}
+        confirm = make_act(ActType.CONFIRM, **fields)
+        assert isinstance(confirm, Confirm)
+        assert make_act("confirm", **fields) == confirm
+        assert make_act("confirm", **{**fields, "type": "confirm"}) == confirm
+
+        with pytest.raises(ValueError, match="Unknown act type"):
+            make_act("unknown", **fields)
+
+    def test_decode_act(self):
+        """Test decoding acts of any type from JSON"""
+        error = decode_act(
+            b'{"id": "act_001", "timestamp": "2025-01-15T14:30:00Z", "speaker": "system",'
+            b' "type": "error", "code": "E1", "message": "Failed", "recoverable": true}'
+        )
+        assert isinstance(error, Error)
+        assert error.severity == ErrorSeverity.ERROR
+
+        ask = Ask(id="act_002", timestamp="2025-01-15T14:30:00Z", speaker="agent",
+                  field="email", prompt="What is your email?")
+        assert decode_act(ask.model_dump_json()) == ask
+
+        with pytest.raises(ValidationError):
+            decode_act('{"id": "act_003", "type": "unknown"}')
+
+    def test_iter_acts(self, monkeypatch):
+        """Test validating the acts of a conversation stream one at a time"""
+        from astra_model import types
+
+        acts = [
+            Ask(id="act_001", timestamp="2025-01-15T14:30:00Z", speaker="agent",
+                field="email", prompt="What is your email?"),
+            Fact(id="act_002", timestamp="2025-01-15T14:30:01Z", speaker="user",
+                 entity="user", field="email", value="a@example.com", confidence=0.5),
+        ]
+        data = json.dumps({
+            "id": "conv_001",
+            "acts": [act.model_dump(mode="json") for act in acts],
+            "final_state": {"order_1": {"status": "placed"}},
+        }).encode()
+        assert list(iter_acts(io.BytesIO(data))) == acts
+
+        # An ijson-style parser that yields the array items one by one
+        fake_ijson = SimpleNamespace(
+            items=lambda stream, prefix, use_float: iter(json.load(stream)["acts"])
+        )
+        monkeypatch.setattr(types, "ijson", fake_ijson)
+        assert list(iter_acts(io.BytesIO(data))) == acts
+
+        invalid = iter_acts(io.BytesIO(b'{"acts": [{"id": "act_001", "type": "unknown"}]}'))
+        with pytest.raises(ValidationError):
+            next(invalid)
+
+    def test_ensure_built(self):
+        """Test building all model validators up front"""
+        from astra_model.types import _MODELS
+
+        ensure_built()
+        assert all(model.__pydantic_complete__ for model in _MODELS)
+        assert Conversation(
+            id="conv_001",
+            participants=[Participant(id="p1", type=ParticipantType.HUMAN)],
+            acts=[]
+        ).id == "conv_001"
+
 
 class TestSerialization:
     """Tests for JSON serialization/deserialization"""
     
-    def test_act_serialization(self):
+    def test_act_serialization(self, canonical_ask):
         """Test Act serialization to/from JSON"""
-        ask = Ask(
-            id="act_001",
-            timestamp="2025-01-15T14:30:00Z",
-            speaker="agent_123",
-            type=ActType.ASK,
-            field="email",
-            prompt="What is your email address?",
-            confidence=0.95
-        )
+        ask = canonical_ask.model_copy(update={"confidence": 0.95})
         
-        # Serialize to JSON
-        json_str = ask.model_dump_json()
-        data = json.loads(json_str)
+        # Dump to JSON-compatible data
+        data = ask.model_dump(mode="json")
         
         assert data["id"] == "act_001"
         assert data["type"] == "ask"
         assert data["confidence"] == 0.95
         
         # Deserialize from JSON
-        ask_loaded = Ask.model_validate_json(json_str)
+        ask_loaded = Ask.model_validate_json(ask.model_dump_json())
         assert ask_loaded.id == ask.id
         assert ask_loaded.type == ask.type
         assert ask_loaded.confidence == ask.confidence
     
-    def test_conversation_serialization(self):
+    def test_conversation_serialization(self, canonical_conversation):
         """Test complete Conversation serialization"""
-        agent = Participant(id="agent_001", type=ParticipantType.AI)
-        customer = Participant(id="customer_123", type=ParticipantType.HUMAN)
-        
-        ask = Ask(
-            id="act_001",
-            timestamp="2025-01-15T14:30:00Z",
-            speaker="agent_001",
-            type=ActType.ASK,
-            field="email",
-            prompt="What is your email?"
-        )
-        
-        fact = Fact(
-            id="act_002",
-            timestamp="2025-01-15T14:31:00Z",
-            speaker="customer_123",
-            type=ActType.FACT,
-            entity="customer_123",
-            field="email",
-            value="user@example.com"
-        )
-        
-        conversation = Conversation(
-            id="conv_001",
-            participants=[agent, customer],
-            acts=[ask, fact],
-            status=ConversationStatus.ACTIVE
-        )
+        conversation = canonical_conversation
         
         # Serialize
         json_str = conversation.model_dump_json()
@@ -406,6 +638,126 @@ class TestSerialization:
         assert isinstance(conversation_loaded.acts[0], Ask)
         assert isinstance(conversation_loaded.acts[1], Fact)
 
+    def test_pickle_round_trip(self):
+        """Test pickling conversations and acts"""
+        conversation = Conversation(
+            id="conv_001",
+            participants=[Participant(id="agent_001", type=ParticipantType.AI)],
+            acts=[
+                Commit(
+                    id="act_001",
+                    timestamp="2025-01-15T14:30:00Z",
+                    speaker="agent_001",
+                    type=ActType.COMMIT,
+                    entity="order_789",
+                    action=CommitAction.CREATE
+                )
+            ]
+        )
+
+        fact = Fact(id="act_002", timestamp="2025-01-15T14:30:00Z", speaker="agent_001",
+                    entity="order_789", field="items", value=(1, 2))
+        unvalidated = create_act("agent_001", ActType.ASK, validate=False, field="email")
+        for model in (conversation, conversation.acts[0], fact, unvalidated):
+            loaded = pickle.loads(pickle.dumps(model))
+            assert type(loaded) is type(model)
+            assert loaded == model
+            assert loaded.model_fields_set == model.model_fields_set
+
+        # Values that JSON cannot represent survive pickling
+        assert pickle.loads(pickle.dumps(fact)).value == (1, 2)
+
+    def test_conversation_lazy_deserialization(self):
+        """Test parsing a Conversation with acts validated on access"""
+        json_str = json.dumps({
+            "id": "conv_001",
+            "participants": [{"id": "agent_001", "type": "ai"}],
+            "status": "completed",
+            "acts": [
+                {
+                    "id": "act_001",
+                    "timestamp": "2025-01-15T14:30:00Z",
+                    "speaker": "agent_001",
+                    "type": "ask",
+                    "field": "email",
+                    "prompt": "What is your email?"
+                },
+                {
+                    "id": "invalid_id",
+                    "timestamp": "2025-01-15T14:31:00Z",
+                    "speaker": "agent_001",
+                    "type": "fact",
+                    "entity": "customer_123",
+                    "field": "email",
+                    "value": "user@example.com"
+                }
+            ]
+        })
+
+        conversation = Conversation.model_validate_json_lazy(json_str)
+
+        # Acts are readable without validating them
+        assert [act["type"] for act in conversation.raw_acts] == ["ask", "fact"]
+        assert len(conversation.acts) == 2
+
+        # Other fields are validated on access
+        assert conversation.status == ConversationStatus.COMPLETED
+        assert conversation.participants[0].type == ParticipantType.AI
+
+        # Each act is validated when read, and only once
+        ask = conversation.acts[0]
+        assert isinstance(ask, Ask)
+        assert conversation.acts[-2] is ask
+        with pytest.raises(ValidationError):
+            conversation.acts[1]
+        with pytest.raises(ValidationError):
+            conversation.to_conversation()
+
+        # Model methods need the full conversation
+        with pytest.raises(AttributeError):
+            conversation.compute_metadata()
+        with pytest.raises(AttributeError):
+            conversation.model_dump()
+        with pytest.raises(ValueError, match="acts"):
+            Conversation.model_validate_json_lazy('{"id": "conv_001"}')
+
+        # Acts that are not objects, or have no known type, fail as in eager validation
+        for raw_act in (["ask"], "act_001", {"type": ["ask"]}, {"type": "unknown"}):
+            lazy = Conversation.model_validate_json_lazy(json.dumps({"id": "conv_001", "acts": [raw_act]}))
+            with pytest.raises(ValidationError):
+                lazy.acts[0]
+
+    def test_conversation_lazy_without_orjson(self, monkeypatch):
+        """Test that the stdlib fallback parses lazy conversations the same way"""
+        from astra_model import types
+
+        json_str = json.dumps({
+            "id": "conv_001",
+            "participants": [{"id": "agent_001", "type": "ai"}],
+            "acts": [],
+        })
+        expected = Conversation.model_validate_json_lazy(json_str).to_conversation()
+        monkeypatch.setattr(types, "orjson", None)
+        assert Conversation.model_validate_json_lazy(json_str).to_conversation() == expected
+        with pytest.raises(ValueError):
+            Conversation.model_validate_json_lazy("[]")
+
+    def test_conversation_lazy_open_fields(self):
+        """Test that open-ended fields are validated only when read"""
+        conversation = Conversation.model_validate_json_lazy(json.dumps({
+            "id": "conv_001",
+            "participants": [{"id": "agent_001", "type": "ai"}],
+            "acts": [],
+            "final_state": {"order_1": {"status": "placed"}},
+            "metadata": {"act_count": -1},
+        }))
+
+        assert conversation.id == "conv_001"
+        assert conversation.final_state == {"order_1": {"status": "placed"}}
+        assert conversation.context is None
+        with pytest.raises(ValidationError):
+            conversation.metadata
+
 
 class TestSchemas:
     """Tests for JSON schemas"""
@@ -417,13 +769,15 @@ class TestSchemas:
             "entity", "participant", "constraint", "conversation"
         ]
         
-        for schema_name in expected_schemas:
-            assert schema_name in SCHEMAS
-            schema = SCHEMAS[schema_name]
-            assert "$schema" in schema
-            assert "$id" in schema
-            assert "title" in schema
-            assert "description" in schema
+        assert set(expected_schemas) <= SCHEMAS.keys()
+        
+        required_keys = frozenset({"$schema", "$id", "title", "description"})
+        missing = {
+            name: required_keys - SCHEMAS[name].keys()
+            for name in expected_schemas
+            if not required_keys <= SCHEMAS[name].keys()
+        }
+        assert not missing, f"schemas missing keys: {missing}"
     
     def test_schema_structure(self):
         """Test schema structure"""
@@ -433,10 +787,9 @@ class TestSchemas:
         assert act_schema["$id"] == "https://schemas.astra.dev/v1/act.json"
         assert act_schema["title"] == "Act"
         assert act_schema["type"] == "object"
-        assert "id" in act_schema["required"]
-        assert "timestamp" in act_schema["required"]
-        assert "speaker" in act_schema["required"]
-        assert "type" in act_schema["required"]
+        assert {"id", "timestamp", "speaker", "type"} <= frozenset(act_schema["required"])
+        assert {"id", "participants", "acts"} <= frozenset(SCHEMAS["conversation"]["required"])
+        assert {"id", "type"} <= frozenset(SCHEMAS["entity"]["required"])
 
 
 class TestConstants:
@@ -448,6 +801,65 @@ class TestConstants:
         assert __schema_version__ == "v1"
 
 
+class TestLazyImports:
+    """Tests for lazily resolved package attributes"""
+
+    def test_import_does_not_load_submodules(self):
+        """Test that importing the package does not build any models"""
+        code = (
+            "import sys, astra_model; "
+            "assert 'astra_model.types' not in sys.modules; "
+            "assert 'astra_model.schemas' not in sys.modules; "
+            "astra_model.Ask; "
+            "assert 'astra_model.types' in sys.modules; "
+            "assert 'astra_model.schemas' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_all_names_resolve(self):
+        """Test that every exported name can be resolved"""
+        for name in astra_model.__all__:
+            assert getattr(astra_model, name) is not None
+        assert set(astra_model.__all__) <= set(dir(astra_model))
+
+    def test_unknown_attribute(self):
+        """Test accessing a name the package does not export"""
+        with pytest.raises(AttributeError):
+            astra_model.NotAType
+
+
+class TestPythonCompatibility:
+    """Tests that the package sources still run on Python 3.8
+
+    mypy only checks against 3.10 and later, so 3.8 support is checked here.
+    """
+
+    def test_sources_use_python_38_syntax(self):
+        """Test for syntax and annotations that need Python 3.9 or later"""
+        builtin_generics = {"dict", "frozenset", "list", "set", "tuple", "type"}
+        package = Path(astra_model.__file__).parent
+        for path in sorted(package.glob("*.py")):
+            tree = ast.parse(path.read_text(), str(path), feature_version=(3, 8))
+            annotations = []
+            for node in ast.walk(tree):
+                # Subscripting builtins fails at runtime on 3.8, wherever it is
+                if isinstance(node, ast.Subscript) and isinstance(node.value, ast.Name):
+                    assert node.value.id not in builtin_generics, f"{path.name}:{node.lineno}"
+                if isinstance(node, ast.arg) and node.annotation is not None:
+                    annotations.append(node.annotation)
+                elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.returns:
+                    annotations.append(node.returns)
+                elif isinstance(node, ast.AnnAssign):
+                    annotations.append(node.annotation)
+            for annotation in annotations:
+                if isinstance(annotation, ast.Constant) and isinstance(annotation.value, str):
+                    annotation = ast.parse(annotation.value, mode="eval")
+                for node in ast.walk(annotation):
+                    # PEP 604 unions; Pydantic evaluates field annotations
+                    is_union = isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr)
+                    assert not is_union, f"{path.name}:{annotation.lineno}"
+
+
 class TestPydanticFeatures:
     """Tests for Pydantic-specific features"""
     
@@ -480,19 +892,12 @@ class TestPydanticFeatures:
         with pytest.raises(ValidationError) as exc_info:
             Ask.model_validate(invalid_data)
         
-        # Should mention the invalid enum value
-        assert "invalid_type" in str(exc_info.value)
+        # Should point at the invalid enum value
+        assert [error["input"] for error in exc_info.value.errors()] == ["invalid_type"]
     
-    def test_model_dump(self):
+    def test_model_dump(self, canonical_ask):
         """Test model dumping to dict/JSON"""
-        ask = Ask(
-            id="act_001",
-            timestamp="2025-01-15T14:30:00Z",
-            speaker="agent_123",
-            type=ActType.ASK,
-            field="email",
-            prompt="What is your email?"
-        )
+        ask = canonical_ask
         
         # Dump to dict
         data = ask.model_dump()
@@ -507,22 +912,15 @@ class TestPydanticFeatures:
         parsed = json.loads(json_str)
         assert parsed["id"] == "act_001"
     
-    def test_model_copy(self):
+    def test_model_copy(self, canonical_ask):
         """Test model copying with updates"""
-        ask = Ask(
-            id="act_001",
-            timestamp="2025-01-15T14:30:00Z",
-            speaker="agent_123",
-            type=ActType.ASK,
-            field="email",
-            prompt="What is your email?"
-        )
+        ask = canonical_ask
         
         # Copy with updates
         ask_copy = ask.model_copy(update={"prompt": "Please provide your email address"})
         
         # Original unchanged
-        assert ask.prompt == "What is your email?"
+        assert ask.prompt == "What is your email address?"
         
         # Copy has updated value
         assert ask_copy.prompt == "Please provide your email address"